@@ -16,10 +16,15 @@ bundle_dir = project_dir / 'bundle'
 # Collect data files
 datas = []
 
-# Add logo image for branding
+# Add pre-scaled logo for branding (see scripts/prescale_logo.py)
 logo_dir = project_dir / 'logo image'
 if logo_dir.exists():
-    datas.append((str(logo_dir), 'logo image'))
+    logo = logo_dir / 'DeVC Logo 56.png'
+    logo_2x = logo_dir / 'DeVC Logo 56@2x.png'
+    if logo.exists():
+        datas.append((str(logo), 'logo image'))
+    if logo_2x.exists():
+        datas.append((str(logo_2x), 'logo image'))
 
 # Add tray icons
 resources_dir = project_dir / 'resources'
@@ -68,6 +68,17 @@ def ensure_icon():
     return run_command([sys.executable, str(PROJECT_DIR / "scripts" / "create_icon.py")])
 
 
+def ensure_logo():
+    """Ensure the pre-scaled branding logo exists."""
+    logo_path = PROJECT_DIR / "logo image" / "DeVC Logo 56.png"
+    if logo_path.exists():
+        print("  Logo already exists")
+        return True
+
+    print("  Pre-scaling branding logo...")
+    return run_command([sys.executable, str(PROJECT_DIR / "scripts" / "prescale_logo.py")])
+
+
 def ensure_bundle():
     """Ensure dependencies are bundled."""
     chromium_dir = BUNDLE_DIR / "chromium"
@@ -269,6 +280,7 @@ def main():
         steps.append(("Cleaning build", clean_build))
 
     steps.append(("Checking icon", ensure_icon))
+    steps.append(("Checking logo", ensure_logo))
 
     if not args.skip_bundle:
         steps.append(("Bundling dependencies", ensure_bundle))
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Pre-scale the DeVC branding logo for the window footer.
+
+The footer shows the logo at a fixed 56px width, so the source PNG is
+resized once here instead of on every launch.
+Outputs to logo image/DeVC Logo 56.png and DeVC Logo 56@2x.png
+"""
+
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:
+    print("PIL not found. Install with: pip install Pillow")
+    exit(1)
+
+# Must match LOGO_WIDTH in topdf_app/ui/main_window.py
+LOGO_WIDTH = 56
+
+SOURCE_NAME = "DeVC Logo PNG.png"
+OUTPUT_STEM = f"DeVC Logo {LOGO_WIDTH}"
+
+
+def scale_logo(source: Image.Image, width: int) -> Image.Image:
+    """Resize the logo to a width, keeping its aspect ratio.
+
+    Args:
+        source: Full-size logo image
+        width: Target width in pixels
+
+    Returns:
+        Resized image
+    """
+    height = round(source.height * width / source.width)
+    return source.resize((width, height), Image.Resampling.LANCZOS)
+
+
+def main():
+    logo_dir = Path(__file__).parent.parent / "logo image"
+    source_path = logo_dir / SOURCE_NAME
+
+    if not source_path.exists():
+        print(f"Source logo not found: {source_path}")
+        return 1
+
+    print("Pre-scaling branding logo...")
+
+    with Image.open(source_path) as source:
+        for scale, suffix in ((1, ""), (2, "@2x")):
+            output_path = logo_dir / f"{OUTPUT_STEM}{suffix}.png"
+            scale_logo(source, LOGO_WIDTH * scale).save(output_path, optimize=True)
+            print(f"  Created {output_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -14,8 +14,9 @@ from unittest.mock import MagicMock, patch
 # Skip all tests if PySide6 is not available
 pytest.importorskip("PySide6")
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QLineEdit
+from PySide6.QtCore import QAbstractAnimation, Qt, QThreadPool
+from PySide6.QtTest import QTest
 
 
 @pytest.fixture(scope="module")
@@ -58,6 +59,32 @@ class TestHomeScreen:
         screen.url_input.setText("https://example.com/test")
         assert not screen.convert_btn.isEnabled()
 
+    def test_status_updates_after_typing_pause(self, app):
+        """Test the status message waits for typing to pause."""
+        from topdf_app.ui.screens.home import HomeScreen
+
+        screen = HomeScreen()
+        screen.url_input.setText("https://docsend.com/view/abc123")
+        assert screen.convert_btn.isEnabled()
+        assert screen.status_label.text() == ""
+
+        QTest.qWait(150)
+        assert "Valid URL" in screen.status_label.text()
+
+        screen.url_input.setText("https://docsend.com")
+        QTest.qWait(150)
+        assert screen.status_label.text() == "Enter a valid DocSend URL"
+
+    def test_is_valid_docsend_url(self, app):
+        """Test the URL check accepts DocSend links and rejects the rest."""
+        from topdf_app.ui.screens.home import is_valid_docsend_url
+
+        assert is_valid_docsend_url("http://docsend.com/view/a")
+        assert is_valid_docsend_url("HTTPS://www.DocSend.com/view/abc123")
+        assert not is_valid_docsend_url("https://docsend.com/view/")
+        assert not is_valid_docsend_url("see https://docsend.com/view/abc123")
+        assert not is_valid_docsend_url("https://docsend.com/view/\u212a")
+
     def test_url_validation_empty(self, app):
         """Test empty URL disables convert button."""
         from topdf_app.ui.screens.home import HomeScreen
@@ -110,6 +137,32 @@ class TestHomeScreen:
         assert len(signal_received) == 1
         assert signal_received[0] == url
 
+    def test_paste_valid_url(self, app):
+        """Test pasting a DocSend URL enables convert and shows status at once."""
+        from topdf_app.ui.screens.home import HomeScreen
+
+        screen = HomeScreen()
+        QApplication.clipboard().setText("  https://docsend.com/view/abc123\n")
+        screen.paste_btn.click()
+
+        assert screen.url_input.text() == "https://docsend.com/view/abc123"
+        assert screen.convert_btn.isEnabled()
+        assert "Valid URL" in screen.status_label.text()
+
+    def test_toast_reuses_timer(self, app):
+        """Test repeated toasts restart one timer instead of adding more."""
+        from PySide6.QtCore import QTimer
+        from topdf_app.ui.screens.home import HomeScreen
+
+        screen = HomeScreen()
+        timers = len(screen.findChildren(QTimer))
+        screen._show_toast("First")
+        screen._show_toast("Second")
+
+        assert len(screen.findChildren(QTimer)) == timers
+        assert screen.toast_label.text() == "Second"
+        assert screen._toast_timer.isActive()
+
 
 class TestProgressScreen:
     """Tests for the progress screen component."""
@@ -164,8 +217,8 @@ class TestCompleteScreen:
 
         screen = CompleteScreen()
         assert screen is not None
-        assert screen.open_btn is not None
-        assert screen.finder_btn is not None
+        # Saved-state actions are only built once the PDF is saved
+        assert screen.saved_section is None
 
     def test_set_result(self, app, tmp_path):
         """Test setting result updates display with editable name."""
@@ -180,9 +233,104 @@ class TestCompleteScreen:
         # Name input should be populated with suggested name
         assert screen.name_input.text() == "Test Company"
         assert "10 pages" in screen.pages_label.text()
-        # Naming section should not be hidden, saved section should be hidden
+        assert screen.save_btn.isEnabled()
+        # Naming section should be shown, saved section not built yet
         assert not screen.naming_section.isHidden()
-        assert screen.saved_section.isHidden()
+        assert screen.saved_section is None
+
+    def test_save_builds_saved_section(self, app, tmp_path):
+        """Test saving shows the saved section with its actions."""
+        from topdf_app.ui.screens.complete import CompleteScreen
+
+        screen = CompleteScreen()
+        pdf_path = tmp_path / "temp.pdf"
+        pdf_path.write_text("test")
+        screen.set_result(str(pdf_path), 3, "Deck", str(tmp_path))
+
+        screen._on_save_clicked()
+        assert screen.save_btn.text() == "Saving..."
+        QThreadPool.globalInstance().waitForDone()
+        QTest.qWait(10)
+        assert screen.naming_section.isHidden()
+        assert not screen.saved_section.isHidden()
+        assert screen.open_btn is not None
+        assert screen.finder_btn is not None
+        assert screen.filename_label.text() == "Deck.pdf"
+        assert (tmp_path / "Deck.pdf").exists()
+
+    def test_save_ignores_replaced_move(self, app, tmp_path):
+        """Test a move finishing after the result was replaced is ignored."""
+        from topdf_app.ui.screens.complete import CompleteScreen
+
+        screen = CompleteScreen()
+        old_path = tmp_path / "old.pdf"
+        old_path.write_text("old")
+        new_path = tmp_path / "new.pdf"
+        new_path.write_text("new")
+
+        screen.set_result(str(old_path), 3, "Old", str(tmp_path))
+        screen._on_save_clicked()
+        # Replace the result and save again before the first move reports
+        screen.set_result(str(new_path), 5, "New", str(tmp_path))
+        screen._on_save_clicked()
+        QThreadPool.globalInstance().waitForDone()
+        QTest.qWait(10)
+
+        assert screen._final_pdf_path == tmp_path / "New.pdf"
+        assert screen.filename_label.text() == "New.pdf"
+        assert (tmp_path / "Old.pdf").exists()
+
+    def test_show_in_finder_does_not_wait(self, app, tmp_path):
+        """Test revealing the PDF on macOS spawns without blocking."""
+        from topdf_app.ui.screens import complete
+        from topdf_app.ui.screens.complete import CompleteScreen
+
+        screen = CompleteScreen()
+        pdf_path = tmp_path / "Deck.pdf"
+        pdf_path.write_text("test")
+        screen._final_pdf_path = pdf_path
+
+        with patch.object(complete.sys, "platform", "darwin"), \
+                patch.object(complete.QProcess, "startDetached") as start:
+            screen._show_in_finder()
+
+        start.assert_called_once_with("open", ["-R", str(pdf_path)])
+
+    def test_sanitize_filename(self, app):
+        """Test invalid characters and whitespace runs are cleaned up."""
+        from topdf_app.ui.screens.complete import CompleteScreen
+
+        screen = CompleteScreen()
+        assert screen._sanitize_filename('Deck: Q1/Q2 <final>') == "Deck Q1Q2 final"
+        assert screen._sanitize_filename("a__b   c.") == "a b c"
+        assert screen._sanitize_filename("?*") == "Document"
+
+    def test_get_unique_path(self, app, tmp_path):
+        """Test taken names get the next free numeric suffix."""
+        from topdf_app.ui.screens.complete import CompleteScreen
+
+        screen = CompleteScreen()
+        target = tmp_path / "Deck.pdf"
+        assert screen._get_unique_path(target) == target
+
+        for name in ("Deck.pdf", "Deck (1).pdf", "Deck (2).pdf"):
+            (tmp_path / name).touch()
+        assert screen._get_unique_path(target) == tmp_path / "Deck (3).pdf"
+
+    def test_get_unique_path_case(self, app, tmp_path):
+        """Test names differing only in case collide only on macOS/Windows."""
+        from topdf_app.ui.screens import complete
+        from topdf_app.ui.screens.complete import CompleteScreen
+
+        screen = CompleteScreen()
+        target = tmp_path / "Deck.pdf"
+        for name in ("Deck.pdf", "deck (1).pdf"):
+            (tmp_path / name).touch()
+
+        with patch.object(complete.sys, "platform", "linux"):
+            assert screen._get_unique_path(target) == tmp_path / "Deck (1).pdf"
+        with patch.object(complete.sys, "platform", "darwin"):
+            assert screen._get_unique_path(target) == tmp_path / "Deck (2).pdf"
 
     def test_success_animation(self, app):
         """Test success animation method exists."""
@@ -230,6 +378,34 @@ class TestErrorScreen:
             screen.set_error(error_msg, "")
             assert expected_fragment.lower() in screen.description_label.text().lower()
 
+    def test_details_hidden_without_traceback(self, app):
+        """Test the details section only shows when there are details."""
+        from topdf_app.ui.screens.error import ErrorScreen
+
+        screen = ErrorScreen()
+        screen.set_error("RuntimeError: Page failed to load", "")
+        assert screen.message_label.text() == "Page failed to load"
+        assert screen.details_container.isHidden()
+
+        screen.set_error("Timeout", "trace")
+        assert not screen.details_container.isHidden()
+
+    def test_new_error_collapses_details(self, app):
+        """Test details expanded for one error start collapsed for the next."""
+        from topdf_app.ui.screens.error import ErrorScreen
+
+        screen = ErrorScreen()
+        screen.set_error("Timeout", "trace")
+        assert screen.details_text is None
+        screen.toggle_btn.click()
+        assert not screen.details_text.isHidden()
+        assert screen.details_text.toPlainText() == "trace"
+        assert "Hide" in screen.toggle_btn.text()
+
+        screen.set_error("Timeout", "trace")
+        assert screen.details_text.isHidden()
+        assert "Show" in screen.toggle_btn.text()
+
     def test_error_animation(self, app):
         """Test error animation method exists."""
         from topdf_app.ui.screens.error import ErrorScreen
@@ -238,6 +414,22 @@ class TestErrorScreen:
         screen.play_error_animation()
         # Should not raise any errors
 
+    def test_shake_returns_icon_to_layout_position(self, app):
+        """Test the shake moves the icon and settles where the layout put it."""
+        from topdf_app.ui.screens.error import ErrorScreen
+
+        screen = ErrorScreen()
+        screen.resize(320, 500)
+        screen.layout().activate()
+        base = screen.icon_label.pos()
+
+        screen._start_shake()
+        QTest.qWait(100)
+        assert screen.icon_label.pos() != base
+        QTest.qWait(450)
+        assert screen.icon_label.pos() == base
+        assert screen.icon_label.styleSheet() == ""
+
 
 class TestAuthEmailScreen:
     """Tests for the auth email screen component."""
@@ -257,12 +449,28 @@ class TestAuthEmailScreen:
 
         screen = AuthEmailScreen()
 
-        screen.email_input.setText("invalid")
+        QTest.keyClicks(screen.email_input, "invalid")
+        QTest.qWait(100)
         assert not screen.submit_btn.isEnabled()
 
-        screen.email_input.setText("valid@example.com")
+        screen.email_input.clear()
+        QTest.keyClicks(screen.email_input, "valid@example.com")
+        # Validation is debounced until typing pauses
+        assert not screen.submit_btn.isEnabled()
+        QTest.qWait(100)
         assert screen.submit_btn.isEnabled()
 
+    def test_is_valid_email(self, app):
+        """Test the email pattern accepts addresses and rejects junk."""
+        from topdf_app.ui.screens.auth_email import is_valid_email
+
+        assert is_valid_email("investor@fund.com")
+        assert is_valid_email("a.b+c@sub.example.co")
+        assert not is_valid_email("a.b@c")
+        assert not is_valid_email("a@@b.com")
+        assert not is_valid_email("a b@c.com")
+        assert not is_valid_email("")
+
     def test_loading_state(self, app):
         """Test loading state disables controls."""
         from topdf_app.ui.screens.auth_email import AuthEmailScreen
@@ -302,13 +510,79 @@ class TestAuthPasscodeScreen:
         assert not screen.submit_btn.isEnabled()
 
         # Only email
-        screen.email_input.setText("test@example.com")
+        QTest.keyClicks(screen.email_input, "test@example.com")
+        QTest.qWait(100)
         assert not screen.submit_btn.isEnabled()
 
         # Both fields
-        screen.passcode_input.setText("secret")
+        QTest.keyClicks(screen.passcode_input, "secret")
+        QTest.qWait(100)
         assert screen.submit_btn.isEnabled()
 
+    def test_submit_before_validation_delay(self, app):
+        """Test pressing Return right after typing submits current values."""
+        from topdf_app.ui.screens.auth_passcode import AuthPasscodeScreen
+
+        screen = AuthPasscodeScreen()
+        submitted = []
+        screen.submit_clicked.connect(lambda e, p: submitted.append((e, p)))
+
+        QTest.keyClicks(screen.email_input, " vc@fund.com ")
+        QTest.keyClicks(screen.passcode_input, "secret")
+        screen._on_submit()
+        assert submitted == [("vc@fund.com", "secret")]
+
+    def test_set_email_validates_prefill(self, app):
+        """Test a programmatic prefill is validated without a typing delay."""
+        from topdf_app.ui.screens.auth_passcode import AuthPasscodeScreen
+
+        screen = AuthPasscodeScreen()
+        QTest.keyClicks(screen.passcode_input, "secret")
+        screen.set_email("vc@fund.com")
+        assert screen.submit_btn.isEnabled()
+
+    def test_error_cleared_by_edit_with_same_validity(self, app):
+        """Test an edit hides a shown error even when validity is unchanged."""
+        from topdf_app.ui.screens.auth_passcode import AuthPasscodeScreen
+
+        screen = AuthPasscodeScreen()
+        screen.set_email("vc@fund.com")
+        QTest.keyClicks(screen.passcode_input, "secret")
+        screen._on_submit()
+        screen.set_loading(False)
+        assert screen.submit_btn.isEnabled()
+
+        screen.set_error("Wrong passcode")
+        QTest.keyClicks(screen.passcode_input, "2")
+        QTest.qWait(100)
+        assert screen.error_label.isHidden()
+        assert screen.submit_btn.isEnabled()
+
+    def test_toggle_password_swaps_icon(self, app):
+        """Test the visibility toggle reveals the passcode and swaps icons."""
+        from topdf_app.ui.screens.auth_passcode import AuthPasscodeScreen
+        from topdf_app.ui.icons import eye_icon
+
+        screen = AuthPasscodeScreen()
+        screen.toggle_btn.click()
+        assert screen.passcode_input.echoMode() == QLineEdit.EchoMode.Normal
+        assert screen.toggle_btn.icon().cacheKey() == eye_icon(slashed=True).cacheKey()
+
+        screen.toggle_btn.click()
+        assert screen.passcode_input.echoMode() == QLineEdit.EchoMode.Password
+        assert screen.toggle_btn.icon().cacheKey() == eye_icon().cacheKey()
+
+    def test_back_arrow_cancels(self, app):
+        """Test the shared header's back arrow cancels authentication."""
+        from topdf_app.ui.screens.auth_passcode import AuthPasscodeScreen
+
+        screen = AuthPasscodeScreen()
+        cancelled = []
+        screen.cancel_clicked.connect(lambda: cancelled.append(True))
+
+        screen.back_btn.click()
+        assert cancelled
+
     def test_loading_state(self, app):
         """Test loading state disables all controls."""
         from topdf_app.ui.screens.auth_passcode import AuthPasscodeScreen
@@ -339,6 +613,104 @@ class TestMainWindow:
         assert window is not None
         assert window.stack is not None
 
+    def test_screens_built_on_first_use(self, app):
+        """Test only the home screen is constructed at startup."""
+        from topdf_app.ui.main_window import MainWindow
+
+        window = MainWindow()
+        assert list(window.screens) == ["home"]
+
+        window.show_screen("error")
+        assert "error" in window.screens
+        assert window.stack.count() == 2
+
+    def test_height_independent_of_built_screens(self, app):
+        """Test a screen's height does not depend on which others exist."""
+        from topdf_app.ui.main_window import MainWindow
+
+        window = MainWindow()
+        home_height = window.height()
+        window.show_screen("auth_passcode")
+        window.show_screen("home")
+        assert window.height() == home_height
+
+    def test_screen_signals_forwarded(self, app):
+        """Test screen signals are re-emitted by the window."""
+        from topdf_app.ui.main_window import MainWindow
+
+        window = MainWindow()
+        emails = []
+        window.auth_email_submitted.connect(emails.append)
+
+        window.get_screen("auth_email").submit_clicked.emit("a@b.com")
+        assert emails == ["a@b.com"]
+
+    def test_screen_geometry_cache_invalidated(self, app):
+        """Test display changes drop the cached screen geometry."""
+        from topdf_app.ui.main_window import MainWindow
+
+        window = MainWindow()
+        window._position_below_tray()
+        assert window._screen_geometry is not None
+
+        screen = app.primaryScreen()
+        screen.availableGeometryChanged.emit(screen.availableGeometry())
+        assert window._screen_geometry is None
+
+        window._position_below_tray()
+        app.primaryScreenChanged.emit(screen)
+        assert window._screen_geometry is None
+
+    def test_progress_animation_follows_visibility(self, app):
+        """Test the progress pulse runs only while its screen is shown."""
+        from topdf_app.ui.main_window import MainWindow
+
+        window = MainWindow()
+        window.show()
+        window.show_screen("progress")
+        progress = window.get_screen("progress")
+        running = QAbstractAnimation.State.Running
+        assert progress.pulse_animation.state() == running
+
+        window.show_screen("home")
+        assert progress.pulse_animation.state() != running
+        window.hide()
+
+    def test_error_animation_plays_once_per_error(self, app):
+        """Test reopening the window does not replay the error animation."""
+        from topdf_app.ui.main_window import MainWindow
+
+        window = MainWindow()
+        error = window.get_screen("error")
+        with patch.object(error, "play_error_animation") as play:
+            error.set_error("Network error: timed out")
+            window.show()
+            window.show_screen("error")
+            assert play.call_count == 1
+
+            window.hide()
+            window.show()
+            assert play.call_count == 1
+
+            error.set_error("Network error: refused")
+            window.show_screen("home")
+            window.show_screen("error")
+            assert play.call_count == 2
+        window.hide()
+
+    def test_settings_values_applied_when_panel_built(self, app):
+        """Test settings values wait for the settings panel to be opened."""
+        from topdf_app.ui.main_window import MainWindow
+
+        window = MainWindow()
+        window.set_settings_values("/tmp/decks", True)
+        assert "settings" not in window.screens
+
+        window.show_screen("settings")
+        panel = window.get_screen("settings")
+        assert panel.save_path_label.text() == "/tmp/decks"
+        assert panel.login_toggle.isChecked()
+
     def test_screen_navigation(self, app):
         """Test navigation between screens."""
         from topdf_app.ui.main_window import MainWindow
@@ -371,6 +743,40 @@ class TestMainWindow:
         # Should still be on home
         assert window.get_current_screen() == "home"
 
+    def test_hides_on_deactivation(self, app):
+        """Test window hides when deactivated on the home screen."""
+        from PySide6.QtCore import QEvent
+        from topdf_app.ui.main_window import MainWindow
+
+        window = MainWindow()
+        window.show()
+        hidden = []
+        window.window_hidden.connect(lambda: hidden.append(True))
+
+        with patch.object(window, "isActiveWindow", return_value=False):
+            QApplication.sendEvent(window, QEvent(QEvent.Type.ActivationChange))
+
+        assert not window.isVisible()
+        # window_hidden is queued until the event loop runs again
+        assert not hidden
+        app.processEvents()
+        assert hidden
+
+    def test_stays_visible_on_deactivation_when_blocked(self, app):
+        """Test deactivation does not hide the window during operations."""
+        from PySide6.QtCore import QEvent
+        from topdf_app.ui.main_window import MainWindow
+
+        window = MainWindow()
+        window.show()
+        window.set_block_focus_hide(True)
+
+        with patch.object(window, "isActiveWindow", return_value=False):
+            QApplication.sendEvent(window, QEvent(QEvent.Type.ActivationChange))
+
+        assert window.isVisible()
+        window.hide()
+
 
 class TestURLValidation:
     """Tests for URL validation function."""
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, Qt
 
 from topdf_app.core.state import StateManager, State
 from topdf_app.core.settings import SettingsManager
@@ -28,7 +28,6 @@ from topdf_app.ui.screens.complete import CompleteScreen
 from topdf_app.ui.screens.error import ErrorScreen
 from topdf_app.ui.screens.auth_email import AuthEmailScreen
 from topdf_app.ui.screens.auth_passcode import AuthPasscodeScreen
-from topdf_app.ui.settings_panel import SettingsPanel
 
 
 class DocSendApp(QObject):
@@ -84,7 +83,11 @@ class DocSendApp(QObject):
         self.tray.quit_requested.connect(self._on_quit)
 
         # Window signals
-        self.window.convert_requested.connect(self._on_convert_requested)
+        # Queued so the home screen paints its "Converting..." state before
+        # the conversion setup runs on the GUI thread
+        self.window.convert_requested.connect(
+            self._on_convert_requested, Qt.ConnectionType.QueuedConnection
+        )
         self.window.cancel_requested.connect(self._on_cancel_requested)
         self.window.retry_requested.connect(self._on_retry_requested)
         self.window.convert_another_requested.connect(self._on_convert_another)
@@ -109,16 +112,14 @@ class DocSendApp(QObject):
         self.state.state_changed.connect(self._on_state_changed)
 
         # Complete screen signals
-        complete_screen = self.window.screens.get("complete")
-        if isinstance(complete_screen, CompleteScreen):
-            complete_screen.file_saved.connect(self._on_file_saved)
+        self.window.file_saved.connect(self._on_file_saved)
 
     def _init_settings_ui(self) -> None:
         """Initialize settings panel with current values."""
-        settings_panel = self.window.screens.get("settings")
-        if isinstance(settings_panel, SettingsPanel):
-            settings_panel.set_save_folder(str(self.settings.save_folder))
-            settings_panel.set_start_at_login(self.settings.start_at_login)
+        # Kept by the window until the panel is first opened
+        self.window.set_settings_values(
+            str(self.settings.save_folder), self.settings.start_at_login
+        )
 
         # Initialize history display
         self._update_history_ui()
@@ -157,10 +158,10 @@ class DocSendApp(QObject):
 
         clipboard = QApplication.clipboard()
         if clipboard:
-            text = clipboard.text()
-            if text and is_valid_docsend_url(text):
+            text = clipboard.text().strip()
+            if is_valid_docsend_url(text):
                 # Auto-fill URL
-                home_screen = self.window.screens.get("home")
+                home_screen = self.window.get_screen("home")
                 if isinstance(home_screen, HomeScreen):
                     home_screen.set_url(text)
 
@@ -200,12 +201,12 @@ class DocSendApp(QObject):
             self.worker.deleteLater()
 
         # Reset home screen loading state
-        home_screen = self.window.screens.get("home")
+        home_screen = self.window.get_screen("home")
         if isinstance(home_screen, HomeScreen):
             home_screen.set_loading(False)
 
         # Reset progress screen
-        progress_screen = self.window.screens.get("progress")
+        progress_screen = self.window.get_screen("progress")
         if isinstance(progress_screen, ProgressScreen):
             progress_screen.reset()
 
@@ -256,7 +257,7 @@ class DocSendApp(QObject):
             percent: Progress percentage (0-100)
             message: Status message
         """
-        progress_screen = self.window.screens.get("progress")
+        progress_screen = self.window.get_screen("progress")
         if isinstance(progress_screen, ProgressScreen):
             progress_screen.set_progress(percent, message)
 
@@ -279,14 +280,14 @@ class DocSendApp(QObject):
         # Show appropriate auth screen
         if auth_type == "email":
             # Reset and show email auth screen
-            auth_screen = self.window.screens.get("auth_email")
+            auth_screen = self.window.get_screen("auth_email")
             if isinstance(auth_screen, AuthEmailScreen):
                 auth_screen.reset()
                 auth_screen.focus_input()
             self.state.set_state(State.AUTH_EMAIL, force=True)
         else:
             # Reset and show passcode auth screen
-            auth_screen = self.window.screens.get("auth_passcode")
+            auth_screen = self.window.get_screen("auth_passcode")
             if isinstance(auth_screen, AuthPasscodeScreen):
                 auth_screen.reset()
                 auth_screen.focus_input()
@@ -303,7 +304,7 @@ class DocSendApp(QObject):
             self.worker.provide_credentials(email)
 
             # Reset auth screen loading state before switching
-            auth_screen = self.window.screens.get("auth_email")
+            auth_screen = self.window.get_screen("auth_email")
             if isinstance(auth_screen, AuthEmailScreen):
                 auth_screen.set_loading(False)
 
@@ -322,7 +323,7 @@ class DocSendApp(QObject):
             self.worker.provide_credentials(email, passcode)
 
             # Reset auth screen loading state before switching
-            auth_screen = self.window.screens.get("auth_passcode")
+            auth_screen = self.window.get_screen("auth_passcode")
             if isinstance(auth_screen, AuthPasscodeScreen):
                 auth_screen.set_loading(False)
 
@@ -365,7 +366,7 @@ class DocSendApp(QObject):
             details: Error traceback
         """
         # Update error screen
-        error_screen = self.window.screens.get("error")
+        error_screen = self.window.get_screen("error")
         if isinstance(error_screen, ErrorScreen):
             error_screen.set_error(message, details)
 
@@ -412,7 +413,7 @@ class DocSendApp(QObject):
         }
 
         screen_name = state_to_screen.get(new_state)
-        if screen_name and screen_name in self.window.screens:
+        if screen_name:
             self.window.show_screen(screen_name)
 
         # Update tray icon for converting state
@@ -425,7 +426,7 @@ class DocSendApp(QObject):
 
     def _show_complete_screen(self) -> None:
         """Show the complete screen with current result."""
-        complete_screen = self.window.screens.get("complete")
+        complete_screen = self.window.get_screen("complete")
         if isinstance(complete_screen, CompleteScreen):
             complete_screen.set_result(
                 self._pending_pdf_path or "",
@@ -504,18 +505,5 @@ class DocSendApp(QObject):
 
     def _update_history_ui(self) -> None:
         """Update history display in tray menu."""
-        entries = self.history.get_all()
-
-        # Format for UI
-        formatted = [
-            {
-                "name": entry.name,
-                "pdf_path": entry.pdf_path,
-                "relative_time": entry.get_relative_time(),
-                "has_summary": entry.has_summary,
-            }
-            for entry in entries
-        ]
-
-        # Update tray menu
-        self.tray.update_history(formatted)
+        # The tray shows at most five entries
+        self.tray.update_history(self.history.get_recent(5))
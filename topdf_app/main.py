@@ -20,6 +20,7 @@ def main() -> int:
     # Import Qt after creating QApplication
     from PySide6.QtWidgets import QApplication
     from PySide6.QtCore import Qt
+    from PySide6.QtGui import QPixmapCache
 
     # Create application
     app = QApplication(sys.argv)
@@ -32,6 +33,9 @@ def main() -> int:
     # Keep running when main window is closed (tray app)
     app.setQuitOnLastWindowClosed(False)
 
+    # Shared cache for small UI pixmaps such as the footer logo (in KB)
+    QPixmapCache.setCacheLimit(2048)
+
     # macOS specific: Hide dock icon (menu bar app only)
     # This is typically done via Info.plist LSUIElement=true
     # But we can also do it programmatically:
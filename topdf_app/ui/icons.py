@@ -0,0 +1,221 @@
+"""Pre-rendered icon pixmaps for the screens.
+
+Round icon badges used to be QLabels styled with border-radius and
+padding, which the stylesheet engine re-rasterizes on every paint.
+They are drawn once here per device pixel ratio and shared, as are the
+line icons that replace color emoji on buttons. Decorative emoji
+labels and buttons use glyph_pixmap() so the glyph is shaped once, not
+per paint.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QFontMetrics,
+    QGuiApplication,
+    QIcon,
+    QPainter,
+    QPainterPath,
+    QPen,
+    QPixmap,
+)
+
+from topdf_app.ui import styles
+
+# Badge diameter and glyph size in logical pixels
+BADGE_SIZE = 80
+BADGE_FONT_SIZE = 48
+
+# Line icon size in logical pixels
+EYE_ICON_SIZE = 20
+
+_badge_pixmaps: Dict[Tuple[str, str, str, float], QPixmap] = {}
+_checkmark_pixmaps: Dict[Tuple[str, float], QPixmap] = {}
+_glyph_pixmaps: Dict[Tuple[str, int, str, float], QPixmap] = {}
+_eye_icons: Dict[Tuple[bool, float], QIcon] = {}
+
+
+def badge_pixmap(
+    glyph: str,
+    background: str,
+    color: Optional[str] = None,
+) -> QPixmap:
+    """Get a round badge with a glyph centered on it.
+
+    Args:
+        glyph: Text or emoji to draw
+        background: Circle fill color
+        color: Glyph color (defaults to the primary text color)
+
+    Returns:
+        BADGE_SIZE square pixmap at the screen's device pixel ratio
+    """
+    color = color or styles.COLORS['text_primary']
+    ratio = QGuiApplication.instance().devicePixelRatio()
+    key = (glyph, background, color, ratio)
+    pixmap = _badge_pixmaps.get(key)
+    if pixmap is not None:
+        return pixmap
+
+    pixmap = QPixmap(round(BADGE_SIZE * ratio), round(BADGE_SIZE * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHints(
+        QPainter.RenderHint.Antialiasing | QPainter.RenderHint.TextAntialiasing
+    )
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(background))
+    painter.drawEllipse(0, 0, BADGE_SIZE, BADGE_SIZE)
+
+    font = QFont()
+    font.setPixelSize(BADGE_FONT_SIZE)
+    painter.setFont(font)
+    painter.setPen(QColor(color))
+    painter.drawText(
+        QRectF(0, 0, BADGE_SIZE, BADGE_SIZE), Qt.AlignmentFlag.AlignCenter, glyph
+    )
+    painter.end()
+
+    _badge_pixmaps[key] = pixmap
+    return pixmap
+
+
+def checkmark_pixmap(background: str) -> QPixmap:
+    """Get a round badge with the success checkmark drawn on it.
+
+    Args:
+        background: Circle fill color
+
+    Returns:
+        BADGE_SIZE square pixmap at the screen's device pixel ratio
+    """
+    ratio = QGuiApplication.instance().devicePixelRatio()
+    key = (background, ratio)
+    pixmap = _checkmark_pixmaps.get(key)
+    if pixmap is not None:
+        return pixmap
+
+    pixmap = QPixmap(round(BADGE_SIZE * ratio), round(BADGE_SIZE * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(background))
+    painter.drawEllipse(0, 0, BADGE_SIZE, BADGE_SIZE)
+
+    pen = QPen(QColor(styles.COLORS['success']), 6)
+    pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+    pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+    painter.setPen(pen)
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    check = QPainterPath()
+    check.moveTo(25, 41)
+    check.lineTo(35, 51)
+    check.lineTo(55, 30)
+    painter.drawPath(check)
+    painter.end()
+
+    _checkmark_pixmaps[key] = pixmap
+    return pixmap
+
+
+def glyph_pixmap(
+    glyph: str,
+    font_size: int,
+    color: Optional[str] = None,
+) -> QPixmap:
+    """Get a glyph rendered on a transparent background.
+
+    The pixmap has the same size a QLabel showing the glyph as text at
+    this font size would have, so swapping one for the other keeps the
+    layout unchanged.
+
+    Args:
+        glyph: Text or emoji to draw
+        font_size: Font size in pixels
+        color: Glyph color (defaults to the primary text color)
+
+    Returns:
+        Pixmap at the screen's device pixel ratio
+    """
+    color = color or styles.COLORS['text_primary']
+    ratio = QGuiApplication.instance().devicePixelRatio()
+    key = (glyph, font_size, color, ratio)
+    pixmap = _glyph_pixmaps.get(key)
+    if pixmap is not None:
+        return pixmap
+
+    font = QFont()
+    font.setPixelSize(font_size)
+    metrics = QFontMetrics(font)
+    width = metrics.horizontalAdvance(glyph)
+    height = metrics.height()
+
+    pixmap = QPixmap(round(width * ratio), round(height * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    painter.setFont(font)
+    painter.setPen(QColor(color))
+    painter.drawText(QRectF(0, 0, width, height), Qt.AlignmentFlag.AlignCenter, glyph)
+    painter.end()
+
+    _glyph_pixmaps[key] = pixmap
+    return pixmap
+
+
+def eye_icon(slashed: bool = False) -> QIcon:
+    """Get the passcode visibility toggle icon.
+
+    Args:
+        slashed: Draw the eye struck through (passcode currently shown)
+
+    Returns:
+        EYE_ICON_SIZE square icon at the screen's device pixel ratio
+    """
+    ratio = QGuiApplication.instance().devicePixelRatio()
+    key = (slashed, ratio)
+    icon = _eye_icons.get(key)
+    if icon is not None:
+        return icon
+
+    size = EYE_ICON_SIZE
+    pixmap = QPixmap(round(size * ratio), round(size * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    color = QColor(styles.COLORS['text_secondary'])
+    pen = QPen(color, 1.6)
+    pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(pen)
+
+    # Almond outline with a filled pupil
+    outline = QPainterPath()
+    outline.moveTo(2, size / 2)
+    outline.quadTo(size / 2, 2, size - 2, size / 2)
+    outline.quadTo(size / 2, size - 2, 2, size / 2)
+    painter.drawPath(outline)
+    painter.setBrush(color)
+    painter.drawEllipse(QPointF(size / 2, size / 2), 2.5, 2.5)
+
+    if slashed:
+        painter.drawLine(QPointF(4, size - 4), QPointF(size - 4, 4))
+    painter.end()
+
+    icon = QIcon(pixmap)
+    _eye_icons[key] = icon
+    return icon
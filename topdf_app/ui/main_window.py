@@ -6,15 +6,18 @@ below the menu bar tray icon, using a QStackedWidget for navigation.
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
-from typing import Optional, Dict, TYPE_CHECKING
+from typing import Callable, Optional, Dict, Tuple, TYPE_CHECKING
 
 from PySide6.QtWidgets import (
     QMainWindow, QStackedWidget, QWidget, QApplication,
-    QVBoxLayout, QPushButton, QFrame, QLabel
+    QVBoxLayout, QHBoxLayout, QPushButton, QFrame, QLabel, QSizePolicy
+)
+from PySide6.QtCore import Qt, Signal, Slot, QEvent, QMetaObject, QRect
+from PySide6.QtGui import (
+    QCloseEvent, QGuiApplication, QPixmap, QPixmapCache, QScreen
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QCloseEvent, QPixmap
 
 if TYPE_CHECKING:
     from PySide6.QtWidgets import QSystemTrayIcon
@@ -29,11 +32,72 @@ from topdf_app.ui.screens.auth_passcode import AuthPasscodeScreen
 from topdf_app.ui.settings_panel import SettingsPanel
 
 
+# Footer logo width in pixels (balanced against the two-line text block)
+LOGO_WIDTH = 56
+
+
+def _resolve_logo_path(suffix: str = "") -> Optional[Path]:
+    """Find the pre-scaled DeVC logo on disk.
+
+    Args:
+        suffix: File name suffix of the variant, e.g. "@2x"
+
+    Returns:
+        Path to the logo image, or None if it is missing
+    """
+    logo_name = f"DeVC Logo {LOGO_WIDTH}{suffix}.png"
+    # Check bundled app location first, then source location
+    if getattr(sys, 'frozen', False):
+        # PyInstaller bundled app
+        app_dir = Path(sys.executable).parent.parent
+        logo_path = app_dir / "Resources" / "logo image" / logo_name
+    else:
+        # Running from source
+        logo_path = Path(__file__).parent.parent.parent / "logo image" / logo_name
+    return logo_path if logo_path.exists() else None
+
+
+# Resolved once at import so each window skips the filesystem lookup
+_LOGO_PATH = _resolve_logo_path()
+_LOGO_2X_PATH = _resolve_logo_path("@2x")
+
+
+def _load_branding_pixmap() -> Optional[QPixmap]:
+    """Load the DeVC logo for the footer.
+
+    The logo ships pre-scaled to LOGO_WIDTH (see scripts/prescale_logo.py),
+    with an @2x variant that is loaded on Retina displays. The decoded
+    pixmap is kept in QPixmapCache and shared by every window.
+
+    Returns:
+        Logo pixmap, or None if the logo image is missing
+    """
+    ratio = QGuiApplication.instance().devicePixelRatio()
+    if ratio > 1 and _LOGO_2X_PATH is not None:
+        path, scale = _LOGO_2X_PATH, 2
+    elif _LOGO_PATH is not None:
+        path, scale = _LOGO_PATH, 1
+    else:
+        return None
+
+    cache_key = f"devc-logo-{LOGO_WIDTH}@{scale}x"
+    pixmap = QPixmapCache.find(cache_key)
+    if pixmap is None:
+        pixmap = QPixmap(str(path))
+        pixmap.setDevicePixelRatio(scale)
+        QPixmapCache.insert(cache_key, pixmap)
+    return pixmap
+
+
 class MainWindow(QMainWindow):
     """Compact main window with stacked screens.
 
+    Screens are constructed on first use (see get_screen), so only the
+    home screen is built at startup.
+
     Signals:
         convert_requested: Emitted when user requests conversion with URL
+        file_saved: Emitted with the final PDF path when the user saves
         window_hidden: Emitted when window is hidden
     """
 
@@ -51,6 +115,7 @@ class MainWindow(QMainWindow):
     settings_closed = Signal()
     save_folder_changed = Signal(str)
     start_at_login_changed = Signal(bool)
+    file_saved = Signal(str)  # final pdf_path
     window_hidden = Signal()
 
     def __init__(self, parent: Optional[QWidget] = None):
@@ -67,12 +132,18 @@ class MainWindow(QMainWindow):
         # Flag to prevent focus-based hiding during active operations
         self._block_focus_hide: bool = False
 
+        # Name of the screen currently shown in the stack
+        self._current_screen: str = "home"
+
+        # Primary screen's available geometry, dropped when screens change
+        self._screen_geometry: Optional[QRect] = None
+
+        # Save folder and start-at-login values for the settings panel,
+        # applied when the panel is first built
+        self._settings_values: Optional[Tuple[str, bool]] = None
+
         self._setup_window()
         self._setup_screens()
-        self._connect_signals()
-
-        # Connect to application focus changes for click-outside-to-close
-        QApplication.instance().focusChanged.connect(self._on_focus_changed)
 
     def set_tray_icon(self, tray_icon: QSystemTrayIcon) -> None:
         """Set the tray icon reference for positioning.
@@ -98,7 +169,16 @@ class MainWindow(QMainWindow):
             | Qt.WindowType.WindowStaysOnTopHint
         )
 
-        # Note: Click-outside-to-close is handled by _on_focus_changed()
+        # Note: Click-outside-to-close is handled by changeEvent()
+
+        # Keep the cached dropdown position in sync with display changes
+        app = QApplication.instance()
+        if app is not None:
+            app.primaryScreenChanged.connect(self._invalidate_screen_geometry)
+            app.screenAdded.connect(self._on_screen_added)
+            app.screenRemoved.connect(self._invalidate_screen_geometry)
+            for screen in app.screens():
+                screen.availableGeometryChanged.connect(self._invalidate_screen_geometry)
 
         # Apply global stylesheet
         self.setStyleSheet(APP_STYLESHEET)
@@ -107,7 +187,7 @@ class MainWindow(QMainWindow):
         # This is handled at the app level via plist
 
     def _setup_screens(self) -> None:
-        """Setup the stacked widget with all screens and footer."""
+        """Setup the stacked widget and footer, then show the home screen."""
         # Create main container
         container = QWidget()
         main_layout = QVBoxLayout(container)
@@ -117,20 +197,22 @@ class MainWindow(QMainWindow):
         # Create stacked widget for screens
         self.stack = QStackedWidget()
 
-        # Create screens
-        self.screens: Dict[str, QWidget] = {
-            "home": HomeScreen(),
-            "progress": ProgressScreen(),
-            "complete": CompleteScreen(),
-            "error": ErrorScreen(),
-            "auth_email": AuthEmailScreen(),
-            "auth_passcode": AuthPasscodeScreen(),
-            "settings": SettingsPanel(),
+        # Screen factories - each screen is built, wired and added to the
+        # stack the first time it is requested
+        self._screen_factories: Dict[str, Callable[[], QWidget]] = {
+            "progress": self._build_progress,
+            "complete": self._build_complete,
+            "error": self._build_error,
+            "auth_email": self._build_auth_email,
+            "auth_passcode": self._build_auth_passcode,
+            "settings": self._build_settings,
         }
+        self.screens: Dict[str, QWidget] = {}
 
-        # Add screens to stack
-        for screen in self.screens.values():
-            self.stack.addWidget(screen)
+        # Home is always shown first, so it is built up front and kept
+        # as a direct reference for navigation
+        self._home = self._build_home()
+        self._add_screen("home", self._home)
 
         # Create footer with Quit button
         footer = self._create_footer()
@@ -144,68 +226,71 @@ class MainWindow(QMainWindow):
         # Start with home screen
         self.show_screen("home")
 
+    def get_screen(self, name: str) -> Optional[QWidget]:
+        """Get a screen widget, constructing it on first use.
+
+        Args:
+            name: Screen name (home, progress, auth_email, etc.)
+
+        Returns:
+            The screen widget, or None if the name is unknown
+        """
+        screen = self.screens.get(name)
+        if screen is None:
+            factory = self._screen_factories.get(name)
+            if factory is None:
+                return None
+            screen = factory()
+            self._add_screen(name, screen)
+        return screen
+
+    def _add_screen(self, name: str, screen: QWidget) -> None:
+        """Register a built screen and add it to the stack.
+
+        Args:
+            name: Screen name
+            screen: The screen widget
+        """
+        self.screens[name] = screen
+        # The stack's size hint spans every page, so idle pages ignore
+        # theirs and the window height only follows the current screen
+        screen.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Ignored)
+        self.stack.addWidget(screen)
+
     def _create_footer(self) -> QFrame:
         """Create the footer widget with branding and Quit button.
 
         Returns:
             Footer frame widget
         """
+        # Footer widgets are styled by object name from APP_STYLESHEET
         footer = QFrame()
         footer.setObjectName("dropdownFooter")
-        footer.setStyleSheet("""
-            #dropdownFooter {
-                background-color: #F9FAFB;
-                border-top: 1px solid #E5E7EB;
-            }
-        """)
 
         layout = QVBoxLayout(footer)
         layout.setContentsMargins(16, 12, 16, 12)
         layout.setSpacing(8)
+        # Hold off layout activation until every child has been added
+        layout.setEnabled(False)
 
         # Dark branded container - clickable, links to devc.com
         branding_container = QPushButton()
         branding_container.setObjectName("brandingContainer")
         branding_container.setCursor(Qt.CursorShape.PointingHandCursor)
         branding_container.setMinimumHeight(80)  # Ensure content is visible
-        branding_container.setStyleSheet("""
-            #brandingContainer {
-                background-color: #1F2937;
-                border-radius: 10px;
-                border: none;
-            }
-            #brandingContainer:hover {
-                background-color: #374151;
-            }
-            #brandingContainer:pressed {
-                background-color: #1F2937;
-            }
-        """)
         branding_container.clicked.connect(self._on_branding_clicked)
 
-        from PySide6.QtWidgets import QHBoxLayout
         branding_layout = QHBoxLayout(branding_container)
         branding_layout.setContentsMargins(16, 14, 20, 14)
         branding_layout.setSpacing(14)
+        branding_layout.setEnabled(False)
 
-        # Logo on left - check bundled app location first, then source location
-        import sys
-        if getattr(sys, 'frozen', False):
-            # PyInstaller bundled app
-            app_dir = Path(sys.executable).parent.parent
-            logo_path = app_dir / "Resources" / "logo image" / "DeVC Logo PNG.png"
-        else:
-            # Running from source
-            logo_path = Path(__file__).parent.parent.parent / "logo image" / "DeVC Logo PNG.png"
-        if logo_path.exists():
+        # Logo on left
+        logo_pixmap = _load_branding_pixmap()
+        if logo_pixmap is not None:
             logo_label = QLabel()
-            logo_label.setStyleSheet("background: transparent;")
-            logo_pixmap = QPixmap(str(logo_path))
-            # Scale to 56px width for balanced horizontal layout
-            scaled_pixmap = logo_pixmap.scaledToWidth(
-                56, Qt.TransformationMode.SmoothTransformation
-            )
-            logo_label.setPixmap(scaled_pixmap)
+            logo_label.setObjectName("brandingLogo")
+            logo_label.setPixmap(logo_pixmap)
             branding_layout.addWidget(logo_label)
 
         # Text container on right - two lines stacked
@@ -214,116 +299,134 @@ class MainWindow(QMainWindow):
 
         # Line 1: "made with ❤️"
         line1 = QLabel("made with ❤️")
-        line1.setStyleSheet("""
-            QLabel {
-                color: #E5E7EB;
-                font-size: 17px;
-                background: transparent;
-            }
-        """)
+        line1.setObjectName("footerLine1")
         text_container.addWidget(line1)
 
         # Line 2: "by team DeVC"
         line2 = QLabel("by team DeVC")
-        line2.setStyleSheet("""
-            QLabel {
-                color: #9CA3AF;
-                font-size: 16px;
-                background: transparent;
-            }
-        """)
+        line2.setObjectName("footerLine2")
         text_container.addWidget(line2)
 
         branding_layout.addLayout(text_container)
         branding_layout.addStretch()  # Push content to left
+        branding_layout.setEnabled(True)
 
         layout.addWidget(branding_container)
 
         # Full-width centered Quit button (styled like secondary button)
         quit_btn = QPushButton("Quit")
+        quit_btn.setObjectName("quitButton")
         quit_btn.setMinimumHeight(40)
         quit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        quit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #F3F4F6;
-                border: 1px solid #E5E7EB;
-                border-radius: 8px;
-                color: #374151;
-                font-size: 14px;
-                font-weight: 500;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #E5E7EB;
-                border-color: #D1D5DB;
-            }
-            QPushButton:pressed {
-                background-color: #D1D5DB;
-            }
-        """)
         quit_btn.clicked.connect(self._on_quit_clicked)
         layout.addWidget(quit_btn)
+        layout.setEnabled(True)
 
         return footer
 
-    def _connect_signals(self) -> None:
-        """Connect screen signals to window signals."""
-        # Home screen
-        home_screen = self.screens["home"]
-        if isinstance(home_screen, HomeScreen):
-            home_screen.convert_clicked.connect(self._on_home_convert_clicked)
-
-        # Progress screen
-        progress_screen = self.screens["progress"]
-        if isinstance(progress_screen, ProgressScreen):
-            progress_screen.cancel_clicked.connect(self.cancel_requested.emit)
-            progress_screen.back_clicked.connect(self._go_home)
-
-        # Complete screen
-        complete_screen = self.screens["complete"]
-        if isinstance(complete_screen, CompleteScreen):
-            complete_screen.convert_another_clicked.connect(self._go_home)
-
-        # Error screen
-        error_screen = self.screens["error"]
-        if isinstance(error_screen, ErrorScreen):
-            error_screen.retry_clicked.connect(self.retry_requested.emit)
-            error_screen.back_clicked.connect(self._go_home)
-
-        # Auth email screen
-        auth_email_screen = self.screens["auth_email"]
-        if isinstance(auth_email_screen, AuthEmailScreen):
-            auth_email_screen.submit_clicked.connect(self.auth_email_submitted.emit)
-            auth_email_screen.cancel_clicked.connect(self.auth_cancelled.emit)
-
-        # Auth passcode screen
-        auth_passcode_screen = self.screens["auth_passcode"]
-        if isinstance(auth_passcode_screen, AuthPasscodeScreen):
-            auth_passcode_screen.submit_clicked.connect(self.auth_passcode_submitted.emit)
-            auth_passcode_screen.cancel_clicked.connect(self.auth_cancelled.emit)
-
-        # Settings panel
-        settings_panel = self.screens["settings"]
-        if isinstance(settings_panel, SettingsPanel):
-            settings_panel.closed.connect(self._on_settings_closed)
-            settings_panel.save_folder_changed.connect(self.save_folder_changed.emit)
-            settings_panel.start_at_login_changed.connect(self.start_at_login_changed.emit)
-
-        # Home screen settings button
-        home_screen = self.screens["home"]
-        if isinstance(home_screen, HomeScreen):
-            home_screen.settings_clicked.connect(self._show_settings)
+    # Screen factories. Screens live on the GUI thread with the window,
+    # so their signals are connected directly.
+
+    def _build_home(self) -> HomeScreen:
+        """Build the home screen and connect its signals."""
+        screen = HomeScreen()
+        direct = Qt.ConnectionType.DirectConnection
+        screen.convert_clicked.connect(self._on_home_convert_clicked, direct)
+        screen.settings_clicked.connect(self._show_settings, direct)
+        return screen
+
+    def _build_progress(self) -> ProgressScreen:
+        """Build the progress screen and connect its signals."""
+        screen = ProgressScreen()
+        direct = Qt.ConnectionType.DirectConnection
+        screen.cancel_clicked.connect(self.cancel_requested, direct)
+        screen.back_clicked.connect(self._go_home, direct)
+        return screen
+
+    def _build_complete(self) -> CompleteScreen:
+        """Build the complete screen and connect its signals."""
+        screen = CompleteScreen()
+        direct = Qt.ConnectionType.DirectConnection
+        screen.convert_another_clicked.connect(self._go_home, direct)
+        screen.file_saved.connect(self.file_saved, direct)
+        return screen
+
+    def _build_error(self) -> ErrorScreen:
+        """Build the error screen and connect its signals."""
+        screen = ErrorScreen()
+        direct = Qt.ConnectionType.DirectConnection
+        screen.retry_clicked.connect(self.retry_requested, direct)
+        screen.back_clicked.connect(self._go_home, direct)
+        return screen
+
+    def _build_auth_email(self) -> AuthEmailScreen:
+        """Build the auth email screen and connect its signals."""
+        screen = AuthEmailScreen()
+        direct = Qt.ConnectionType.DirectConnection
+        screen.submit_clicked.connect(self.auth_email_submitted, direct)
+        screen.cancel_clicked.connect(self.auth_cancelled, direct)
+        return screen
+
+    def _build_auth_passcode(self) -> AuthPasscodeScreen:
+        """Build the auth passcode screen and connect its signals."""
+        screen = AuthPasscodeScreen()
+        direct = Qt.ConnectionType.DirectConnection
+        screen.submit_clicked.connect(self.auth_passcode_submitted, direct)
+        screen.cancel_clicked.connect(self.auth_cancelled, direct)
+        return screen
+
+    def _build_settings(self) -> SettingsPanel:
+        """Build the settings panel and connect its signals."""
+        screen = SettingsPanel()
+        direct = Qt.ConnectionType.DirectConnection
+        screen.closed.connect(self._on_settings_closed, direct)
+        screen.save_folder_changed.connect(self.save_folder_changed, direct)
+        screen.start_at_login_changed.connect(self.start_at_login_changed, direct)
+        if self._settings_values is not None:
+            self._apply_settings_values(screen, self._settings_values)
+        return screen
+
+    def set_settings_values(self, save_folder: str, start_at_login: bool) -> None:
+        """Set the values shown in the settings panel.
+
+        The panel is only built when first opened, so the values are kept
+        and applied then.
+
+        Args:
+            save_folder: Folder converted PDFs are saved to
+            start_at_login: Whether the app launches at login
+        """
+        values = self._settings_values = (save_folder, start_at_login)
+        panel = self.screens.get("settings")
+        if isinstance(panel, SettingsPanel):
+            self._apply_settings_values(panel, values)
+
+    def _apply_settings_values(
+        self, panel: SettingsPanel, values: Tuple[str, bool]
+    ) -> None:
+        """Show settings values in the panel.
+
+        Args:
+            panel: The settings panel
+            values: Save folder and start-at-login values
+        """
+        save_folder, start_at_login = values
+        panel.set_save_folder(save_folder)
+        panel.set_start_at_login(start_at_login)
 
+    @Slot()
     def _show_settings(self) -> None:
         """Show the settings panel."""
-        self.settings_requested.emit()
+        self._emit_queued("settings_requested")
         self.show_screen("settings")
 
+    @Slot()
     def _on_settings_closed(self) -> None:
         """Handle settings panel closed."""
         self.settings_closed.emit()
         self.show_screen("home")
 
+    @Slot(str)
     def _on_home_convert_clicked(self, url: str) -> None:
         """Handle convert click from home screen.
 
@@ -336,13 +439,12 @@ class MainWindow(QMainWindow):
         self._block_focus_hide = True
         self.convert_requested.emit(url)
 
+    @Slot()
     def _go_home(self) -> None:
         """Navigate to home screen and emit signal."""
         self.show_screen("home")
         # Clear the URL input for fresh start
-        home_screen = self.screens.get("home")
-        if isinstance(home_screen, HomeScreen):
-            home_screen.clear_input()
+        self._home.clear_input()
         self.convert_another_requested.emit()
 
     def show_screen(self, name: str) -> None:
@@ -351,49 +453,39 @@ class MainWindow(QMainWindow):
         Args:
             name: Screen name (home, progress, auth_email, etc.)
         """
-        if name not in self.screens:
+        screen = self.get_screen(name)
+        if screen is None:
             return
 
-        # Stop animations on the previous screen
-        current_screen = self.stack.currentWidget()
-        if isinstance(current_screen, ProgressScreen):
-            current_screen.stop_animation()
-
-        self.stack.setCurrentWidget(self.screens[name])
-        # Adjust window size to fit content
+        # Only the outgoing and incoming pages change, so just update those
+        previous = self.stack.currentWidget()
+        screen.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        self.stack.setCurrentWidget(screen)
+        if previous is not None and previous is not screen:
+            previous.setSizePolicy(
+                QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Ignored
+            )
+        self._current_screen = name
+        # Adjust window size to fit content. The size policy changes only
+        # reach the window's layout on the next event loop pass, so drop
+        # its cached size hints now.
+        self.stack.updateGeometry()
+        self.centralWidget().updateGeometry()
         self.adjustSize()
 
-        # Trigger screen-specific animations
-        if name == "progress":
-            progress_screen = self.screens.get("progress")
-            if isinstance(progress_screen, ProgressScreen):
-                progress_screen.start_animation()
-        elif name == "complete":
-            complete_screen = self.screens.get("complete")
-            if isinstance(complete_screen, CompleteScreen):
-                complete_screen.play_success_animation()
-        elif name == "error":
-            error_screen = self.screens.get("error")
-            if isinstance(error_screen, ErrorScreen):
-                error_screen.play_error_animation()
-
     def get_current_screen(self) -> str:
         """Get the name of the currently displayed screen.
 
         Returns:
             Screen name
         """
-        current_widget = self.stack.currentWidget()
-        for name, widget in self.screens.items():
-            if widget is current_widget:
-                return name
-        return "home"
+        return self._current_screen
 
     def toggle_visibility(self) -> None:
         """Toggle window visibility."""
         if self.isVisible():
             self.hide()
-            self.window_hidden.emit()
+            self._emit_queued("window_hidden")
         else:
             # Position first, then show to avoid flicker
             self._position_below_tray()
@@ -401,8 +493,6 @@ class MainWindow(QMainWindow):
             # Ensure window comes to front on macOS
             self.raise_()
             self.activateWindow()
-            # Process events to ensure window is fully shown
-            QApplication.processEvents()
 
     def _position_below_tray(self) -> None:
         """Position the dropdown panel centered below the menu bar.
@@ -410,15 +500,42 @@ class MainWindow(QMainWindow):
         Centers horizontally on screen, positioned just below the menu bar.
         This matches the macOS Calendar app behavior.
         """
-        screen = QApplication.primaryScreen()
-        if screen:
-            geometry = screen.availableGeometry()
+        geometry = self._available_geometry()
+        if geometry is not None:
             # Center horizontally
             x = geometry.center().x() - self.width() // 2
             # Position just below menu bar (availableGeometry excludes menu bar)
             y = geometry.top() + 4
             self.move(x, y)
 
+    def _available_geometry(self) -> Optional[QRect]:
+        """Get the primary screen's available geometry, cached between calls.
+
+        Returns:
+            Available geometry, or None if there is no screen
+        """
+        if self._screen_geometry is None:
+            screen = QApplication.primaryScreen()
+            if screen is None:
+                return None
+            self._screen_geometry = screen.availableGeometry()
+        return self._screen_geometry
+
+    @Slot()
+    def _invalidate_screen_geometry(self) -> None:
+        """Drop the cached screen geometry after a display change."""
+        self._screen_geometry = None
+
+    @Slot(QScreen)
+    def _on_screen_added(self, screen: QScreen) -> None:
+        """Track geometry changes on a newly connected display.
+
+        Args:
+            screen: The screen that was added
+        """
+        screen.availableGeometryChanged.connect(self._invalidate_screen_geometry)
+        self._invalidate_screen_geometry()
+
     def closeEvent(self, event: QCloseEvent) -> None:
         """Handle window close event.
 
@@ -429,35 +546,39 @@ class MainWindow(QMainWindow):
         """
         event.ignore()
         self.hide()
-        self.window_hidden.emit()
+        self._emit_queued("window_hidden")
 
+    @Slot()
     def _on_quit_clicked(self) -> None:
         """Handle quit button click - clean shutdown."""
-        # Disconnect focus handler to prevent interference during quit
-        try:
-            QApplication.instance().focusChanged.disconnect(self._on_focus_changed)
-        except RuntimeError:
-            pass  # Already disconnected
-
         # Hide window first
         self.hide()
 
         # Quit application
         QApplication.quit()
 
+    @Slot()
     def _on_branding_clicked(self) -> None:
         """Handle branding container click - open DeVC website."""
         from PySide6.QtGui import QDesktopServices
         from PySide6.QtCore import QUrl
         QDesktopServices.openUrl(QUrl("https://www.devc.com"))
 
-    def _on_focus_changed(self, old, new) -> None:
-        """Handle application focus changes.
+    def changeEvent(self, event: QEvent) -> None:
+        """Handle window state changes.
+
+        Hides the dropdown when the window is deactivated (click outside).
+        Only this window's activation changes reach Python, rather than
+        every focus change in the application.
 
-        Hides the dropdown when focus moves outside of it.
-        This is more reliable than WindowDeactivate for Tool windows on macOS.
+        Args:
+            event: The change event
         """
-        if not self.isVisible():
+        super().changeEvent(event)
+        if event.type() != QEvent.Type.ActivationChange:
+            return
+
+        if self.isActiveWindow() or not self.isVisible():
             return
 
         # Don't hide during active operations (conversion, auth submission)
@@ -467,17 +588,22 @@ class MainWindow(QMainWindow):
         # Don't hide if we're on an operational screen (not home/settings)
         # This is a robust fallback - if we're showing progress, auth, complete,
         # or error screens, the user is in the middle of something
-        current_screen = self.get_current_screen()
-        if current_screen not in ("home", "settings"):
+        if self.get_current_screen() not in ("home", "settings"):
             return
 
-        # If new focus widget is None or not a child of this window, hide
-        if new is None:
-            self.hide()
-            self.window_hidden.emit()
-        elif not self.isAncestorOf(new) and new is not self:
-            self.hide()
-            self.window_hidden.emit()
+        self.hide()
+        self._emit_queued("window_hidden")
+
+    def _emit_queued(self, signal_name: str) -> None:
+        """Emit a window signal once control returns to the event loop.
+
+        Used from close, activation and navigation handlers so receivers
+        never run inside Qt's own event handling.
+
+        Args:
+            signal_name: Name of the signal to emit
+        """
+        QMetaObject.invokeMethod(self, signal_name, Qt.ConnectionType.QueuedConnection)
 
     def set_block_focus_hide(self, block: bool) -> None:
         """Set whether to block focus-based window hiding.
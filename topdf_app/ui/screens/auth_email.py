@@ -5,19 +5,40 @@ Prompts user to enter their email to access the document.
 
 from __future__ import annotations
 
+import re
 from typing import Optional
 
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
-    QHBoxLayout,
     QLabel,
     QLineEdit,
     QPushButton,
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Qt, QTimer
 
 from topdf_app.ui import styles
+from topdf_app.ui.icons import BADGE_SIZE, badge_pixmap
+from topdf_app.ui.screens.header import BackHeader
+
+
+# Delay before validating, so a burst of keystrokes validates once
+VALIDATE_DELAY_MS = 80
+
+# Email pattern: something@domain.tld with no whitespace
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def is_valid_email(email: str) -> bool:
+    """Check if a string looks like an email address.
+
+    Args:
+        email: Email string to validate (already stripped)
+
+    Returns:
+        True if it looks like an email address
+    """
+    return bool(EMAIL_PATTERN.fullmatch(email))
 
 
 class AuthEmailScreen(QWidget):
@@ -38,58 +59,43 @@ class AuthEmailScreen(QWidget):
             parent: Optional parent widget
         """
         super().__init__(parent)
+        self._last_text: str = ""
+        # Stripped email as of the last validation
+        self._last_email: str = ""
+
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(VALIDATE_DELAY_MS)
+        self._validate_timer.timeout.connect(
+            self._validate, Qt.ConnectionType.DirectConnection
+        )
+
         self._setup_ui()
 
     def _setup_ui(self) -> None:
         """Setup the UI components."""
+        # All connections below stay on the GUI thread
+        direct = Qt.ConnectionType.DirectConnection
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(16)
 
         # Header with back arrow
-        header = QHBoxLayout()
-        self.back_btn = QPushButton("\u2190")  # Left arrow
-        self.back_btn.setFixedSize(32, 32)
-        self.back_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                font-size: 18px;
-                color: {styles.COLORS['text_secondary']};
-            }}
-            QPushButton:hover {{
-                color: {styles.COLORS['text_primary']};
-            }}
-        """)
-        self.back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.back_btn.clicked.connect(self.cancel_clicked.emit)
-        header.addWidget(self.back_btn)
-
-        title = QLabel("Authentication")
-        title.setStyleSheet(styles.LABEL_TITLE_STYLE)
-        header.addWidget(title)
-        header.addStretch()
-        layout.addLayout(header)
+        self.header = BackHeader("Authentication")
+        self.header.back_clicked.connect(self.cancel_clicked, direct)
+        self.back_btn = self.header.back_btn
+        layout.addWidget(self.header)
 
         # Spacer
         layout.addStretch()
 
         # Lock icon
-        icon_container = QHBoxLayout()
-        icon_container.addStretch()
-        self.icon_label = QLabel("\U0001F512")  # Lock emoji
-        self.icon_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 48px;
-                background-color: {styles.COLORS['surface']};
-                border-radius: 40px;
-                padding: 16px 20px;
-            }}
-        """)
-        self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_container.addWidget(self.icon_label)
-        icon_container.addStretch()
-        layout.addLayout(icon_container)
+        self.icon_label = QLabel()
+        self.icon_label.setPixmap(
+            badge_pixmap("\U0001F512", styles.COLORS['surface'])  # Lock emoji
+        )
+        self.icon_label.setFixedSize(BADGE_SIZE, BADGE_SIZE)
+        layout.addWidget(self.icon_label, 0, Qt.AlignmentFlag.AlignHCenter)
 
         layout.addSpacing(16)
 
@@ -117,8 +123,8 @@ class AuthEmailScreen(QWidget):
         self.email_input.setPlaceholderText("investor@fund.com")
         self.email_input.setStyleSheet(styles.INPUT_STYLE)
         self.email_input.setMinimumHeight(44)
-        self.email_input.textChanged.connect(self._on_text_changed)
-        self.email_input.returnPressed.connect(self._on_submit)
+        self.email_input.textEdited.connect(self._on_text_changed, direct)
+        self.email_input.returnPressed.connect(self._on_submit, direct)
         layout.addWidget(self.email_input)
 
         # Error label
@@ -134,17 +140,17 @@ class AuthEmailScreen(QWidget):
         # Continue button
         self.submit_btn = QPushButton("Continue")
         self.submit_btn.setStyleSheet(styles.BUTTON_PRIMARY_STYLE)
-        self.submit_btn.setMinimumHeight(44)
+        self.submit_btn.setFixedHeight(44)
         self.submit_btn.setEnabled(False)
-        self.submit_btn.clicked.connect(self._on_submit)
+        self.submit_btn.clicked.connect(self._on_submit, direct)
         layout.addWidget(self.submit_btn)
 
         # Cancel button
         self.cancel_btn = QPushButton("Cancel")
         self.cancel_btn.setStyleSheet(styles.BUTTON_SECONDARY_STYLE)
-        self.cancel_btn.setMinimumHeight(44)
+        self.cancel_btn.setFixedHeight(44)
         self.cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.cancel_btn.clicked.connect(self.cancel_clicked.emit)
+        self.cancel_btn.clicked.connect(self.cancel_clicked, direct)
         layout.addWidget(self.cancel_btn)
 
     def _on_text_changed(self, text: str) -> None:
@@ -153,14 +159,26 @@ class AuthEmailScreen(QWidget):
         Args:
             text: Current input text
         """
-        # Simple email validation
-        is_valid = "@" in text and "." in text and len(text) >= 5
+        # Qt can repeat textEdited with the same text (e.g. IME composition)
+        if text == self._last_text:
+            return
+        self._last_text = text
+        self._validate_timer.start()
+
+    def _validate(self) -> None:
+        """Enable submit when the email looks valid."""
+        self._last_email = self.email_input.text().strip()
+        is_valid = is_valid_email(self._last_email)
         self.submit_btn.setEnabled(is_valid)
         self.error_label.hide()
 
     def _on_submit(self) -> None:
         """Handle submit button click."""
-        email = self.email_input.text().strip()
+        # Catch up if Return was pressed before the validation delay ran
+        if self._validate_timer.isActive():
+            self._validate_timer.stop()
+            self._validate()
+        email = self._last_email
         if email and "@" in email:
             self.set_loading(True)
             self.submit_clicked.emit(email)
@@ -171,19 +189,25 @@ class AuthEmailScreen(QWidget):
         Args:
             loading: Whether to show loading state
         """
-        if loading:
-            self.submit_btn.setEnabled(False)
-            self.submit_btn.setText("Verifying...")
-            self.email_input.setEnabled(False)
-            self.back_btn.setEnabled(False)
-            self.cancel_btn.setEnabled(False)
-        else:
-            self.submit_btn.setText("Continue")
-            self.email_input.setEnabled(True)
-            self.back_btn.setEnabled(True)
-            self.cancel_btn.setEnabled(True)
-            # Re-enable submit if email is valid
-            self._on_text_changed(self.email_input.text())
+        # Coalesce the enable/disable changes into a single repaint
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            if loading:
+                self.submit_btn.setEnabled(False)
+                self.submit_btn.setText("Verifying...")
+                self.email_input.setEnabled(False)
+                self.back_btn.setEnabled(False)
+                self.cancel_btn.setEnabled(False)
+            else:
+                self.submit_btn.setText("Continue")
+                self.email_input.setEnabled(True)
+                self.back_btn.setEnabled(True)
+                self.cancel_btn.setEnabled(True)
+                # Re-enable submit if email is valid
+                self._validate()
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
 
     def set_error(self, message: str) -> None:
         """Display an error message.
@@ -196,10 +220,17 @@ class AuthEmailScreen(QWidget):
 
     def reset(self) -> None:
         """Reset screen to initial state."""
-        self.email_input.clear()
-        self.error_label.hide()
-        self.submit_btn.setEnabled(False)
-        self.set_loading(False)
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self.email_input.clear()
+            self._last_text = ""
+            self._validate_timer.stop()
+            self.error_label.hide()
+            self.submit_btn.setEnabled(False)
+            self.set_loading(False)
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
 
     def focus_input(self) -> None:
         """Focus the email input field."""
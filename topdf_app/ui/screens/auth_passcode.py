@@ -5,7 +5,7 @@ Prompts user to enter email and passcode to access the document.
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, Tuple
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -15,9 +15,33 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QPushButton,
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Qt, QSize, QTimer
 
 from topdf_app.ui import styles
+from topdf_app.ui.icons import BADGE_SIZE, EYE_ICON_SIZE, badge_pixmap, eye_icon
+from topdf_app.ui.screens.header import BackHeader
+from topdf_app.ui.screens.auth_email import VALIDATE_DELAY_MS, is_valid_email
+
+# Passcode input joins the show/hide toggle on its right edge
+_PASSCODE_INPUT_STYLE = styles.INPUT_STYLE + """
+QLineEdit {
+    border-top-right-radius: 0;
+    border-bottom-right-radius: 0;
+}
+"""
+
+_TOGGLE_BTN_STYLE = f"""
+QPushButton {{
+    background-color: {styles.COLORS['surface']};
+    border: 1px solid {styles.COLORS['border']};
+    border-left: none;
+    border-top-right-radius: 8px;
+    border-bottom-right-radius: 8px;
+}}
+QPushButton:hover {{
+    background-color: {styles.COLORS['border']};
+}}
+"""
 
 
 class AuthPasscodeScreen(QWidget):
@@ -38,58 +62,46 @@ class AuthPasscodeScreen(QWidget):
             parent: Optional parent widget
         """
         super().__init__(parent)
+
+        # Field values as of the last validation
+        self._last_email: str = ""
+        self._last_passcode: str = ""
+        # (email_valid, passcode_valid) last applied to the UI, None to force
+        self._last_valid: Optional[Tuple[bool, bool]] = (False, False)
+
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(VALIDATE_DELAY_MS)
+        self._validate_timer.timeout.connect(
+            self._validate, Qt.ConnectionType.DirectConnection
+        )
+
         self._setup_ui()
 
     def _setup_ui(self) -> None:
         """Setup the UI components."""
+        # All connections below stay on the GUI thread
+        direct = Qt.ConnectionType.DirectConnection
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(12)
 
         # Header with back arrow
-        header = QHBoxLayout()
-        self.back_btn = QPushButton("\u2190")  # Left arrow
-        self.back_btn.setFixedSize(32, 32)
-        self.back_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                font-size: 18px;
-                color: {styles.COLORS['text_secondary']};
-            }}
-            QPushButton:hover {{
-                color: {styles.COLORS['text_primary']};
-            }}
-        """)
-        self.back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.back_btn.clicked.connect(self.cancel_clicked.emit)
-        header.addWidget(self.back_btn)
-
-        title = QLabel("Authentication")
-        title.setStyleSheet(styles.LABEL_TITLE_STYLE)
-        header.addWidget(title)
-        header.addStretch()
-        layout.addLayout(header)
+        self.header = BackHeader("Authentication")
+        self.header.back_clicked.connect(self.cancel_clicked, direct)
+        self.back_btn = self.header.back_btn
+        layout.addWidget(self.header)
 
         # Spacer
         layout.addStretch()
 
         # Key icon
-        icon_container = QHBoxLayout()
-        icon_container.addStretch()
-        self.icon_label = QLabel("\U0001F510")  # Lock with key emoji
-        self.icon_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 48px;
-                background-color: {styles.COLORS['surface']};
-                border-radius: 40px;
-                padding: 16px 20px;
-            }}
-        """)
-        self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_container.addWidget(self.icon_label)
-        icon_container.addStretch()
-        layout.addLayout(icon_container)
+        self.icon_label = QLabel()
+        self.icon_label.setPixmap(
+            badge_pixmap("\U0001F510", styles.COLORS['surface'])  # Lock with key emoji
+        )
+        self.icon_label.setFixedSize(BADGE_SIZE, BADGE_SIZE)
+        layout.addWidget(self.icon_label, 0, Qt.AlignmentFlag.AlignHCenter)
 
         layout.addSpacing(12)
 
@@ -117,7 +129,7 @@ class AuthPasscodeScreen(QWidget):
         self.email_input.setPlaceholderText("investor@fund.com")
         self.email_input.setStyleSheet(styles.INPUT_STYLE)
         self.email_input.setMinimumHeight(40)
-        self.email_input.textChanged.connect(self._on_text_changed)
+        self.email_input.textEdited.connect(self._on_text_changed, direct)
         layout.addWidget(self.email_input)
 
         layout.addSpacing(8)
@@ -134,34 +146,19 @@ class AuthPasscodeScreen(QWidget):
         self.passcode_input = QLineEdit()
         self.passcode_input.setPlaceholderText("Enter passcode")
         self.passcode_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.passcode_input.setStyleSheet(styles.INPUT_STYLE + """
-            QLineEdit {
-                border-top-right-radius: 0;
-                border-bottom-right-radius: 0;
-            }
-        """)
+        self.passcode_input.setStyleSheet(_PASSCODE_INPUT_STYLE)
         self.passcode_input.setMinimumHeight(40)
-        self.passcode_input.textChanged.connect(self._on_text_changed)
-        self.passcode_input.returnPressed.connect(self._on_submit)
+        self.passcode_input.textEdited.connect(self._on_text_changed, direct)
+        self.passcode_input.returnPressed.connect(self._on_submit, direct)
         passcode_container.addWidget(self.passcode_input)
 
         # Show/hide toggle button
-        self.toggle_btn = QPushButton("\U0001F441")  # Eye emoji
+        self.toggle_btn = QPushButton()
+        self.toggle_btn.setIcon(eye_icon())
+        self.toggle_btn.setIconSize(QSize(EYE_ICON_SIZE, EYE_ICON_SIZE))
         self.toggle_btn.setFixedSize(44, 40)
-        self.toggle_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {styles.COLORS['surface']};
-                border: 1px solid {styles.COLORS['border']};
-                border-left: none;
-                border-top-right-radius: 8px;
-                border-bottom-right-radius: 8px;
-                font-size: 16px;
-            }}
-            QPushButton:hover {{
-                background-color: {styles.COLORS['border']};
-            }}
-        """)
-        self.toggle_btn.clicked.connect(self._toggle_password)
+        self.toggle_btn.setStyleSheet(_TOGGLE_BTN_STYLE)
+        self.toggle_btn.clicked.connect(self._toggle_password, direct)
         passcode_container.addWidget(self.toggle_btn)
 
         layout.addLayout(passcode_container)
@@ -179,44 +176,56 @@ class AuthPasscodeScreen(QWidget):
         # Continue button
         self.submit_btn = QPushButton("Continue")
         self.submit_btn.setStyleSheet(styles.BUTTON_PRIMARY_STYLE)
-        self.submit_btn.setMinimumHeight(44)
+        self.submit_btn.setFixedHeight(44)
         self.submit_btn.setEnabled(False)
-        self.submit_btn.clicked.connect(self._on_submit)
+        self.submit_btn.clicked.connect(self._on_submit, direct)
         layout.addWidget(self.submit_btn)
 
         # Cancel button
         self.cancel_btn = QPushButton("Cancel")
         self.cancel_btn.setStyleSheet(styles.BUTTON_SECONDARY_STYLE)
-        self.cancel_btn.setMinimumHeight(44)
+        self.cancel_btn.setFixedHeight(44)
         self.cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.cancel_btn.clicked.connect(self.cancel_clicked.emit)
+        self.cancel_btn.clicked.connect(self.cancel_clicked, direct)
         layout.addWidget(self.cancel_btn)
 
     def _on_text_changed(self, _: str) -> None:
-        """Handle input change."""
-        email = self.email_input.text().strip()
-        passcode = self.passcode_input.text()
+        """Handle input change by (re)starting the validation delay."""
+        self._validate_timer.start()
+
+    def _validate(self) -> None:
+        """Enable submit when both fields are valid."""
+        self._last_email = email = self.email_input.text().strip()
+        self._last_passcode = passcode = self.passcode_input.text()
 
         # Validate both fields
-        email_valid = "@" in email and "." in email and len(email) >= 5
-        passcode_valid = len(passcode) >= 1
+        valid = (is_valid_email(email), len(passcode) >= 1)
+
+        # Autofill and IME bursts often leave validity unchanged
+        if valid == self._last_valid:
+            return
+        self._last_valid = valid
 
-        self.submit_btn.setEnabled(email_valid and passcode_valid)
+        self.submit_btn.setEnabled(all(valid))
         self.error_label.hide()
 
     def _toggle_password(self) -> None:
         """Toggle password visibility."""
         if self.passcode_input.echoMode() == QLineEdit.EchoMode.Password:
             self.passcode_input.setEchoMode(QLineEdit.EchoMode.Normal)
-            self.toggle_btn.setText("\U0001F441\u200D\U0001F5E8")  # Eye with speech
+            self.toggle_btn.setIcon(eye_icon(slashed=True))
         else:
             self.passcode_input.setEchoMode(QLineEdit.EchoMode.Password)
-            self.toggle_btn.setText("\U0001F441")  # Eye
+            self.toggle_btn.setIcon(eye_icon())
 
     def _on_submit(self) -> None:
         """Handle submit button click."""
-        email = self.email_input.text().strip()
-        passcode = self.passcode_input.text()
+        # Catch up if Return was pressed before the validation delay ran
+        if self._validate_timer.isActive():
+            self._validate_timer.stop()
+            self._validate()
+        email = self._last_email
+        passcode = self._last_passcode
 
         if email and "@" in email and passcode:
             self.set_loading(True)
@@ -228,23 +237,30 @@ class AuthPasscodeScreen(QWidget):
         Args:
             loading: Whether to show loading state
         """
-        if loading:
-            self.submit_btn.setEnabled(False)
-            self.submit_btn.setText("Verifying...")
-            self.email_input.setEnabled(False)
-            self.passcode_input.setEnabled(False)
-            self.back_btn.setEnabled(False)
-            self.toggle_btn.setEnabled(False)
-            self.cancel_btn.setEnabled(False)
-        else:
-            self.submit_btn.setText("Continue")
-            self.email_input.setEnabled(True)
-            self.passcode_input.setEnabled(True)
-            self.back_btn.setEnabled(True)
-            self.toggle_btn.setEnabled(True)
-            self.cancel_btn.setEnabled(True)
-            # Re-enable submit if fields are valid
-            self._on_text_changed("")
+        # Coalesce the enable/disable changes into a single repaint
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            if loading:
+                self._last_valid = None
+                self.submit_btn.setEnabled(False)
+                self.submit_btn.setText("Verifying...")
+                self.email_input.setEnabled(False)
+                self.passcode_input.setEnabled(False)
+                self.back_btn.setEnabled(False)
+                self.toggle_btn.setEnabled(False)
+                self.cancel_btn.setEnabled(False)
+            else:
+                self.submit_btn.setText("Continue")
+                self.email_input.setEnabled(True)
+                self.passcode_input.setEnabled(True)
+                self.back_btn.setEnabled(True)
+                self.toggle_btn.setEnabled(True)
+                self.cancel_btn.setEnabled(True)
+                # Re-enable submit if fields are valid
+                self._validate()
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
 
     def set_error(self, message: str) -> None:
         """Display an error message.
@@ -254,16 +270,25 @@ class AuthPasscodeScreen(QWidget):
         """
         self.error_label.setText(message)
         self.error_label.show()
+        # Let the next edit hide the error even if validity is unchanged
+        self._last_valid = None
 
     def reset(self) -> None:
         """Reset screen to initial state."""
-        self.email_input.clear()
-        self.passcode_input.clear()
-        self.passcode_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.toggle_btn.setText("\U0001F441")
-        self.error_label.hide()
-        self.submit_btn.setEnabled(False)
-        self.set_loading(False)
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self.email_input.clear()
+            self.passcode_input.clear()
+            self._validate_timer.stop()
+            self.passcode_input.setEchoMode(QLineEdit.EchoMode.Password)
+            self.toggle_btn.setIcon(eye_icon())
+            self.error_label.hide()
+            self.submit_btn.setEnabled(False)
+            self._last_valid = None
+            self.set_loading(False)
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
 
     def set_email(self, email: str) -> None:
         """Pre-fill the email field.
@@ -272,6 +297,8 @@ class AuthPasscodeScreen(QWidget):
             email: Email to pre-fill
         """
         self.email_input.setText(email)
+        # setText does not emit textEdited, so validate the prefill here
+        self._validate()
 
     def focus_input(self) -> None:
         """Focus the appropriate input field."""
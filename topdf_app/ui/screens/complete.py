@@ -7,8 +7,9 @@ Two-phase flow:
 
 from __future__ import annotations
 
+import re
 import shutil
-import subprocess
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -21,10 +22,85 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QGraphicsOpacityEffect,
 )
-from PySide6.QtCore import Signal, Qt, QPropertyAnimation, QEasingCurve, QTimer, QUrl
-from PySide6.QtGui import QDesktopServices
+from PySide6.QtCore import (
+    Signal,
+    Qt,
+    QObject,
+    QProcess,
+    QPropertyAnimation,
+    QEasingCurve,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    QUrl,
+)
+from PySide6.QtGui import QDesktopServices, QShowEvent
 
 from topdf_app.ui import styles
+from topdf_app.ui.icons import BADGE_SIZE, checkmark_pixmap
+
+# Filename cleanup: characters not allowed in file names, and runs of
+# whitespace/underscores collapsed to a single space
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+_WHITESPACE_RE = re.compile(r"[\s_]+")
+
+# Success icon flash color
+ICON_FLASH_BACKGROUND = "#22C55E"
+
+_FILENAME_STYLE = f"""
+QLabel {{
+    font-size: {styles.FONTS['body_size']};
+    font-weight: 500;
+    color: {styles.COLORS['text_primary']};
+    padding: 8px 12px;
+    background-color: {styles.COLORS['surface']};
+    border-radius: 8px;
+}}
+"""
+
+
+class _MoveSignals(QObject):
+    """Signals for _MoveTask (QRunnable is not a QObject).
+
+    Signals:
+        done: (move_id, final_path, error) - Move finished; error is empty
+            on success
+    """
+
+    done = Signal(int, str, str)
+
+
+class _MoveTask(QRunnable):
+    """Moves the temporary PDF to its final path on a pool thread.
+
+    A cross-filesystem move degrades to copy + unlink, which would
+    otherwise block painting and the countdown timer.
+    """
+
+    def __init__(self, move_id: int, source: Path, destination: Path):
+        """Initialize the move task.
+
+        Args:
+            move_id: Identifies this move in the done signal
+            source: Temporary PDF path
+            destination: Final PDF path
+        """
+        super().__init__()
+        # Created on the GUI thread, so done is delivered back there queued
+        self.signals = _MoveSignals()
+        self._move_id = move_id
+        self._source = source
+        self._destination = destination
+
+    def run(self) -> None:
+        """Move the file and report the outcome."""
+        try:
+            if self._source != self._destination:
+                shutil.move(str(self._source), str(self._destination))
+        except Exception as e:
+            self.signals.done.emit(self._move_id, str(self._destination), str(e))
+        else:
+            self.signals.done.emit(self._move_id, str(self._destination), "")
 
 
 class CompleteScreen(QWidget):
@@ -40,6 +116,14 @@ class CompleteScreen(QWidget):
     discard_clicked = Signal()
     file_saved = Signal(str)  # Final PDF path
 
+    # Countdown button text, indexed by seconds remaining
+    _COUNTDOWN_LABELS = (
+        "Convert Another",
+        "Back to home in 1...",
+        "Back to home in 2...",
+        "Back to home in 3...",
+    )
+
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize complete screen.
 
@@ -54,16 +138,28 @@ class CompleteScreen(QWidget):
         self._original_name: str = ""
         self._output_dir: Optional[Path] = None
         self._is_saved: bool = False
+        # Ids of the last started move and of the one still awaited, so a
+        # move for a replaced result is ignored when it finishes
+        self._move_count: int = 0
+        self._current_move_id: Optional[int] = None
+        # Set by set_result(), cleared once the entry animation has played
+        self._animation_pending: bool = False
 
         # Countdown timer for auto-return to home
         self._countdown_seconds: int = 3
-        self._countdown_timer: Optional[QTimer] = None
+        self._countdown_timer = QTimer(self)
+        self._countdown_timer.setInterval(1000)  # 1 second interval
+        self._countdown_timer.timeout.connect(
+            self._on_countdown_tick, Qt.ConnectionType.DirectConnection
+        )
 
         self._setup_ui()
         self._setup_animations()
 
     def _setup_ui(self) -> None:
         """Setup the UI components."""
+        # All connections below stay on the GUI thread
+        direct = Qt.ConnectionType.DirectConnection
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(16)
@@ -78,22 +174,10 @@ class CompleteScreen(QWidget):
         layout.addStretch()
 
         # Success icon
-        icon_container = QHBoxLayout()
-        icon_container.addStretch()
-        self.icon_label = QLabel("\u2713")  # Checkmark
-        self.icon_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 48px;
-                color: {styles.COLORS['success']};
-                background-color: {styles.COLORS['surface']};
-                border-radius: 40px;
-                padding: 16px 20px;
-            }}
-        """)
-        self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_container.addWidget(self.icon_label)
-        icon_container.addStretch()
-        layout.addLayout(icon_container)
+        self.icon_label = QLabel()
+        self.icon_label.setPixmap(checkmark_pixmap(styles.COLORS['surface']))
+        self.icon_label.setFixedSize(BADGE_SIZE, BADGE_SIZE)
+        layout.addWidget(self.icon_label, 0, Qt.AlignmentFlag.AlignHCenter)
 
         # Page count
         self.pages_label = QLabel("0 pages captured")
@@ -119,7 +203,7 @@ class CompleteScreen(QWidget):
         self.name_input.setStyleSheet(styles.INPUT_STYLE)
         self.name_input.setMinimumHeight(44)
         self.name_input.setPlaceholderText("Enter a name...")
-        self.name_input.textChanged.connect(self._on_name_changed)
+        self.name_input.textEdited.connect(self._on_name_changed, direct)
         naming_layout.addWidget(self.name_input)
 
         # Button row: Save and Discard
@@ -129,22 +213,49 @@ class CompleteScreen(QWidget):
         # Discard button (secondary)
         self.discard_btn = QPushButton("Discard")
         self.discard_btn.setStyleSheet(styles.BUTTON_SECONDARY_STYLE)
-        self.discard_btn.setMinimumHeight(44)
+        self.discard_btn.setFixedHeight(44)
         self.discard_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.discard_btn.clicked.connect(self._on_discard_clicked)
+        self.discard_btn.clicked.connect(self._on_discard_clicked, direct)
         button_row.addWidget(self.discard_btn)
 
         # Save button (primary)
         self.save_btn = QPushButton("Save PDF")
         self.save_btn.setStyleSheet(styles.BUTTON_PRIMARY_STYLE)
-        self.save_btn.setMinimumHeight(44)
-        self.save_btn.clicked.connect(self._on_save_clicked)
+        self.save_btn.setFixedHeight(44)
+        self.save_btn.clicked.connect(self._on_save_clicked, direct)
         button_row.addWidget(self.save_btn)
 
         naming_layout.addLayout(button_row)
         layout.addWidget(self.naming_section)
 
         # === SAVED SECTION (shown after save) ===
+        # Built on first save by _ensure_saved_section()
+        self.saved_section: Optional[QWidget] = None
+
+        # Spacer
+        layout.addStretch()
+
+        # Convert another link with countdown (only shown after save)
+        self.another_btn = QPushButton("Back to home in 3...")
+        self.another_btn.setStyleSheet(styles.BUTTON_TEXT_STYLE)
+        self.another_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.another_btn.clicked.connect(self._on_convert_another_clicked, direct)
+        self.another_btn.hide()  # Hidden until saved
+        layout.addWidget(self.another_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+
+    def _ensure_saved_section(self) -> QWidget:
+        """Build the saved section on first use.
+
+        Discarded conversions never need it, so it is not built with the
+        rest of the UI.
+
+        Returns:
+            The saved section widget
+        """
+        if self.saved_section is not None:
+            return self.saved_section
+
+        direct = Qt.ConnectionType.DirectConnection
         self.saved_section = QWidget()
         saved_layout = QVBoxLayout(self.saved_section)
         saved_layout.setContentsMargins(0, 0, 0, 0)
@@ -152,16 +263,7 @@ class CompleteScreen(QWidget):
 
         # Saved filename
         self.filename_label = QLabel("document.pdf")
-        self.filename_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: {styles.FONTS['body_size']};
-                font-weight: 500;
-                color: {styles.COLORS['text_primary']};
-                padding: 8px 12px;
-                background-color: {styles.COLORS['surface']};
-                border-radius: 8px;
-            }}
-        """)
+        self.filename_label.setStyleSheet(_FILENAME_STYLE)
         self.filename_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.filename_label.setWordWrap(True)
         saved_layout.addWidget(self.filename_label)
@@ -171,30 +273,21 @@ class CompleteScreen(QWidget):
         # Open PDF button
         self.open_btn = QPushButton("Open PDF")
         self.open_btn.setStyleSheet(styles.BUTTON_PRIMARY_STYLE)
-        self.open_btn.setMinimumHeight(44)
-        self.open_btn.clicked.connect(self._open_pdf)
+        self.open_btn.setFixedHeight(44)
+        self.open_btn.clicked.connect(self._open_pdf, direct)
         saved_layout.addWidget(self.open_btn)
 
         # Show in Finder button
         self.finder_btn = QPushButton("Show in Finder")
         self.finder_btn.setStyleSheet(styles.BUTTON_SECONDARY_STYLE)
-        self.finder_btn.setMinimumHeight(44)
-        self.finder_btn.clicked.connect(self._show_in_finder)
+        self.finder_btn.setFixedHeight(44)
+        self.finder_btn.clicked.connect(self._show_in_finder, direct)
         saved_layout.addWidget(self.finder_btn)
 
-        self.saved_section.hide()
-        layout.addWidget(self.saved_section)
-
-        # Spacer
-        layout.addStretch()
-
-        # Convert another link with countdown (only shown after save)
-        self.another_btn = QPushButton("Back to home in 3...")
-        self.another_btn.setStyleSheet(styles.BUTTON_TEXT_STYLE)
-        self.another_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.another_btn.clicked.connect(self._on_convert_another_clicked)
-        self.another_btn.hide()  # Hidden until saved
-        layout.addWidget(self.another_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+        # Insert directly below the naming section
+        layout = self.layout()
+        layout.insertWidget(layout.indexOf(self.naming_section) + 1, self.saved_section)
+        return self.saved_section
 
     def _setup_animations(self) -> None:
         """Setup success animation effects."""
@@ -208,21 +301,25 @@ class CompleteScreen(QWidget):
         self.fade_animation.setEndValue(1.0)
         self.fade_animation.setEasingCurve(QEasingCurve.Type.OutBack)
 
-        self._original_icon_style = self.icon_label.styleSheet()
-
     def play_success_animation(self) -> None:
         """Play the success celebration animation."""
         self.icon_opacity.setOpacity(0.0)
         self.fade_animation.start()
 
-        self.icon_label.setStyleSheet(self._original_icon_style + """
-            QLabel { background-color: #22C55E; }
-        """)
+        # Flash the circle green by swapping pre-rendered pixmaps
+        self.icon_label.setPixmap(checkmark_pixmap(ICON_FLASH_BACKGROUND))
         QTimer.singleShot(300, self._restore_icon_style)
 
     def _restore_icon_style(self) -> None:
         """Restore icon to normal style after animation."""
-        self.icon_label.setStyleSheet(self._original_icon_style)
+        self.icon_label.setPixmap(checkmark_pixmap(styles.COLORS['surface']))
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Play the success animation the first time a new result is shown."""
+        super().showEvent(event)
+        if self._animation_pending:
+            self._animation_pending = False
+            self.play_success_animation()
 
     def set_result(
         self,
@@ -244,19 +341,27 @@ class CompleteScreen(QWidget):
         self._original_name = suggested_name
         self._output_dir = Path(output_dir) if output_dir else self._temp_pdf_path.parent
         self._is_saved = False
+        self._current_move_id = None
 
         # Update UI for naming phase
         self.title_label.setText("PDF Ready!")
         self.pages_label.setText(f"{page_count} page{'s' if page_count != 1 else ''} captured")
         self.name_input.setText(suggested_name)
-        self.save_btn.setEnabled(True)
+        self.name_input.setEnabled(True)
+        self.discard_btn.setEnabled(True)
         self.save_btn.setText("Save PDF")
 
         # Show naming section, hide saved section
         self.naming_section.show()
-        self.saved_section.hide()
+        if self.saved_section is not None:
+            self.saved_section.hide()
         self.another_btn.hide()
 
+        # setText does not emit textEdited, so sync the save button here
+        self._on_name_changed(suggested_name)
+
+        self._animation_pending = True
+
     def _on_name_changed(self, text: str) -> None:
         """Handle name input change."""
         self.save_btn.setEnabled(bool(text.strip()))
@@ -287,36 +392,61 @@ class CompleteScreen(QWidget):
         # Handle existing file
         final_path = self._get_unique_path(final_path)
 
-        # Move/rename file
-        try:
-            if self._temp_pdf_path != final_path:
-                shutil.move(str(self._temp_pdf_path), str(final_path))
-            self._final_pdf_path = final_path
-            self._is_saved = True
+        # Move/rename file off the GUI thread
+        self.save_btn.setEnabled(False)
+        self.save_btn.setText("Saving...")
+        self.name_input.setEnabled(False)
+        self.discard_btn.setEnabled(False)
+
+        self._move_count += 1
+        self._current_move_id = self._move_count
+        task = _MoveTask(self._current_move_id, self._temp_pdf_path, final_path)
+        task.signals.done.connect(self._on_move_done)
+        QThreadPool.globalInstance().start(task)
 
-            # Update UI to saved state
-            self.title_label.setText("Saved!")
-            self.filename_label.setText(final_path.name)
-            self.naming_section.hide()
-            self.saved_section.show()
-            self.another_btn.show()
+    def _on_move_done(self, move_id: int, final_path: str, error: str) -> None:
+        """Handle the end of the background move.
 
-            # Start countdown for auto-return to home
-            self._start_countdown()
+        Args:
+            move_id: Id of the move that finished
+            final_path: Destination the PDF was moved to
+            error: Error message, empty on success
+        """
+        if move_id != self._current_move_id:
+            return  # A new result replaced the one being saved
+        self._current_move_id = None
 
-            # Emit signal
-            self.file_saved.emit(str(final_path))
+        self.name_input.setEnabled(True)
+        self.discard_btn.setEnabled(True)
 
-        except Exception as e:
+        if error:
             # Show error in button
-            self.save_btn.setText(f"Error: {str(e)[:30]}")
+            self.save_btn.setEnabled(True)
+            self.save_btn.setText(f"Error: {error[:30]}")
             QTimer.singleShot(2000, lambda: self.save_btn.setText("Save PDF"))
+            return
+
+        self._final_pdf_path = Path(final_path)
+        self._is_saved = True
+
+        # Update UI to saved state
+        self.title_label.setText("Saved!")
+        self._ensure_saved_section()
+        self.filename_label.setText(self._final_pdf_path.name)
+        self.naming_section.hide()
+        self.saved_section.show()
+        self.another_btn.show()
+
+        # Start countdown for auto-return to home
+        self._start_countdown()
+
+        # Emit signal
+        self.file_saved.emit(final_path)
 
     def _sanitize_filename(self, name: str) -> str:
         """Remove invalid filename characters."""
-        import re
-        sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "", name)
-        sanitized = re.sub(r"[\s_]+", " ", sanitized).strip(" .")
+        sanitized = _INVALID_CHARS_RE.sub("", name)
+        sanitized = _WHITESPACE_RE.sub(" ", sanitized).strip(" .")
         return sanitized[:100] if sanitized else "Document"
 
     def _get_unique_path(self, path: Path) -> Path:
@@ -329,11 +459,14 @@ class CompleteScreen(QWidget):
         parent = path.parent
         counter = 1
 
-        while True:
-            new_path = parent / f"{stem} ({counter}){suffix}"
-            if not new_path.exists():
-                return new_path
+        # List the folder once rather than stat-ing each candidate. Names
+        # are casefolded on macOS and Windows, whose volumes are usually
+        # case-insensitive.
+        fold = str.casefold if sys.platform in ("darwin", "win32") else str
+        existing = {fold(p.name) for p in parent.iterdir()}
+        while fold(f"{stem} ({counter}){suffix}") in existing:
             counter += 1
+        return parent / f"{stem} ({counter}){suffix}"
 
     def _open_pdf(self) -> None:
         """Open the PDF in the default application."""
@@ -342,26 +475,32 @@ class CompleteScreen(QWidget):
             QDesktopServices.openUrl(QUrl.fromLocalFile(str(path)))
 
     def _show_in_finder(self) -> None:
-        """Show the PDF in Finder."""
+        """Show the PDF in Finder.
+
+        The reveal is launched as a detached process, so the UI never
+        blocks on it and no child is left to reap.
+        """
         path = self._final_pdf_path or self._temp_pdf_path
-        if path and path.exists():
-            subprocess.run(["open", "-R", str(path)])
+        if not path or not path.exists():
+            return
+
+        if sys.platform == "darwin":
+            QProcess.startDetached("open", ["-R", str(path)])
+        elif sys.platform == "win32":
+            QProcess.startDetached("explorer", [f"/select,{path}"])
+        else:
+            # No portable "select file" action, so open the containing folder
+            QDesktopServices.openUrl(QUrl.fromLocalFile(str(path.parent)))
 
     def _start_countdown(self) -> None:
         """Start the countdown timer for auto-return to home."""
         self._countdown_seconds = 3
         self._update_countdown_label()
-
-        # Create and start timer
-        self._countdown_timer = QTimer(self)
-        self._countdown_timer.timeout.connect(self._on_countdown_tick)
-        self._countdown_timer.start(1000)  # 1 second interval
+        self._countdown_timer.start()
 
     def _stop_countdown(self) -> None:
         """Stop the countdown timer."""
-        if self._countdown_timer:
-            self._countdown_timer.stop()
-            self._countdown_timer = None
+        self._countdown_timer.stop()
 
     def _on_countdown_tick(self) -> None:
         """Handle countdown timer tick."""
@@ -374,10 +513,9 @@ class CompleteScreen(QWidget):
 
     def _update_countdown_label(self) -> None:
         """Update the countdown button text."""
-        if self._countdown_seconds > 0:
-            self.another_btn.setText(f"Back to home in {self._countdown_seconds}...")
-        else:
-            self.another_btn.setText("Convert Another")
+        self.another_btn.setText(
+            self._COUNTDOWN_LABELS[max(0, self._countdown_seconds)]
+        )
 
     def _on_convert_another_clicked(self) -> None:
         """Handle convert another button click - stops countdown and goes home."""
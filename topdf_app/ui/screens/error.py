@@ -5,7 +5,8 @@ Displays error message with expandable details and retry option.
 
 from __future__ import annotations
 
-from typing import Optional
+import re
+from typing import FrozenSet, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -13,13 +14,67 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTextEdit,
+    QPlainTextEdit,
     QFrame,
     QGraphicsOpacityEffect,
 )
-from PySide6.QtCore import Signal, Qt, QPropertyAnimation, QSequentialAnimationGroup, QTimer
+from PySide6.QtCore import Signal, Qt, QPoint, QPropertyAnimation, QTimer
+from PySide6.QtGui import QShowEvent
 
 from topdf_app.ui import styles
+from topdf_app.ui.icons import BADGE_SIZE, badge_pixmap
+
+# Every keyword the descriptions below depend on. The lookahead reports
+# overlapping matches, so the result equals a set of substring tests.
+_ERROR_KEYWORD_RE = re.compile(
+    r"(?=(timeout|timed out|timed|network|connection|invalid|email|passcode"
+    r"|permission|url|load|tesseract|api|key))"
+)
+
+# Checked in order: (any of, and any of, but none of, description)
+_ERROR_DESCRIPTIONS: Tuple[
+    Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str], str], ...
+] = (
+    (
+        frozenset({"timeout", "timed out"}), frozenset(), frozenset(),
+        "The connection took too long.\nCheck your internet and try again.",
+    ),
+    (
+        frozenset({"network", "connection"}), frozenset(), frozenset({"timed"}),
+        "Network connection failed.\nPlease check your internet connection.",
+    ),
+    (
+        frozenset({"invalid"}), frozenset({"email", "passcode"}), frozenset(),
+        "The credentials were rejected.\nPlease check and try again.",
+    ),
+    (
+        frozenset({"permission"}), frozenset(), frozenset(),
+        "Cannot save to this location.\nTry a different folder in Settings.",
+    ),
+    (
+        frozenset({"url"}), frozenset(), frozenset(),
+        "The URL format is invalid.\nMake sure it's a DocSend link.",
+    ),
+    (
+        frozenset({"load"}), frozenset(), frozenset(),
+        "Could not load the document.\nIt may be unavailable or restricted.",
+    ),
+    (
+        frozenset({"tesseract"}), frozenset(), frozenset(),
+        "OCR engine not found.\nInstall Tesseract for AI summaries.",
+    ),
+    (
+        frozenset({"api", "key"}), frozenset(), frozenset(),
+        "API key issue.\nCheck your Perplexity key in Settings.",
+    ),
+)
+
+_DEFAULT_ERROR_DESCRIPTION = (
+    "The conversion could not be completed.\nPlease check your internet and try again."
+)
+
+# Icon shake pattern: right, left, right, left, center
+_SHAKE_OFFSETS: Tuple[int, ...] = (8, -8, 6, -6, 4, -4, 2, -2, 0)
 
 
 class ErrorScreen(QWidget):
@@ -44,6 +99,8 @@ class ErrorScreen(QWidget):
         self._error_message: str = ""
         self._error_details: str = ""
         self._details_visible: bool = False
+        # Set by set_error(), cleared once the entry animation has played
+        self._animation_pending: bool = False
 
         self._setup_ui()
         self._setup_animations()
@@ -58,17 +115,7 @@ class ErrorScreen(QWidget):
         header = QHBoxLayout()
         self.back_btn = QPushButton("\u2190")  # Left arrow
         self.back_btn.setFixedSize(32, 32)
-        self.back_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                font-size: 18px;
-                color: {styles.COLORS['text_secondary']};
-            }}
-            QPushButton:hover {{
-                color: {styles.COLORS['text_primary']};
-            }}
-        """)
+        self.back_btn.setStyleSheet(styles.BUTTON_BACK_STYLE)
         self.back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.back_btn.clicked.connect(self.back_clicked.emit)
         header.addWidget(self.back_btn)
@@ -83,22 +130,12 @@ class ErrorScreen(QWidget):
         layout.addStretch()
 
         # Error icon
-        icon_container = QHBoxLayout()
-        icon_container.addStretch()
-        self.icon_label = QLabel("\u2717")  # X mark
-        self.icon_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 48px;
-                color: {styles.COLORS['error']};
-                background-color: #FEE2E2;
-                border-radius: 40px;
-                padding: 16px 20px;
-            }}
-        """)
-        self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_container.addWidget(self.icon_label)
-        icon_container.addStretch()
-        layout.addLayout(icon_container)
+        self.icon_label = QLabel()
+        self.icon_label.setPixmap(
+            badge_pixmap("\u2717", "#FEE2E2", styles.COLORS['error'])  # X mark
+        )
+        self.icon_label.setFixedSize(BADGE_SIZE, BADGE_SIZE)
+        layout.addWidget(self.icon_label, 0, Qt.AlignmentFlag.AlignHCenter)
 
         layout.addSpacing(16)
 
@@ -121,51 +158,20 @@ class ErrorScreen(QWidget):
 
         # Expandable details section
         self.details_container = QFrame()
-        self.details_container.setStyleSheet(f"""
-            QFrame {{
-                background-color: {styles.COLORS['surface']};
-                border: 1px solid {styles.COLORS['border']};
-                border-radius: 8px;
-            }}
-        """)
+        self.details_container.setObjectName("errorDetails")
         details_layout = QVBoxLayout(self.details_container)
         details_layout.setContentsMargins(12, 8, 12, 8)
         details_layout.setSpacing(8)
 
         # Toggle button
         self.toggle_btn = QPushButton("\u25B6  Show Details")  # Right triangle
-        self.toggle_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                color: {styles.COLORS['text_secondary']};
-                font-size: {styles.FONTS['caption_size']};
-                text-align: left;
-                padding: 4px;
-            }}
-            QPushButton:hover {{
-                color: {styles.COLORS['text_primary']};
-            }}
-        """)
+        self.toggle_btn.setObjectName("errorDetailsToggle")
         self.toggle_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.toggle_btn.clicked.connect(self._toggle_details)
         details_layout.addWidget(self.toggle_btn)
 
-        # Details text
-        self.details_text = QTextEdit()
-        self.details_text.setReadOnly(True)
-        self.details_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {styles.COLORS['surface']};
-                border: none;
-                color: {styles.COLORS['text_secondary']};
-                font-family: 'SF Mono', 'Monaco', 'Menlo', monospace;
-                font-size: 11px;
-            }}
-        """)
-        self.details_text.setFixedHeight(100)
-        self.details_text.hide()
-        details_layout.addWidget(self.details_text)
+        # Details text, built the first time the details are expanded
+        self.details_text: Optional[QPlainTextEdit] = None
 
         layout.addWidget(self.details_container)
 
@@ -175,7 +181,7 @@ class ErrorScreen(QWidget):
         # Retry button
         self.retry_btn = QPushButton("Retry")
         self.retry_btn.setStyleSheet(styles.BUTTON_PRIMARY_STYLE)
-        self.retry_btn.setMinimumHeight(44)
+        self.retry_btn.setFixedHeight(44)
         self.retry_btn.clicked.connect(self.retry_clicked.emit)
         layout.addWidget(self.retry_btn)
 
@@ -193,57 +199,92 @@ class ErrorScreen(QWidget):
         self.icon_label.setGraphicsEffect(self.icon_opacity)
         self.icon_opacity.setOpacity(1.0)
 
-        # Store original position for shake
-        self._original_style = self.icon_label.styleSheet()
-        self._shake_step = 0
+        # Quick fade in
+        self.fade_anim = QPropertyAnimation(self.icon_opacity, b"opacity")
+        self.fade_anim.setDuration(200)
+        self.fade_anim.setStartValue(0.0)
+        self.fade_anim.setEndValue(1.0)
+
+        # Shake: keyframes are set from the laid-out position at start
+        self.shake_anim = QPropertyAnimation(self.icon_label, b"pos")
+        self.shake_anim.setDuration(450)
 
     def play_error_animation(self) -> None:
         """Play shake animation for error feedback."""
         # Fade in and shake effect
         self.icon_opacity.setOpacity(0.0)
 
-        # Quick fade in
-        self.fade_anim = QPropertyAnimation(self.icon_opacity, b"opacity")
-        self.fade_anim.setDuration(200)
-        self.fade_anim.setStartValue(0.0)
-        self.fade_anim.setEndValue(1.0)
+        # Quick fade in (restarts from 0 if already running)
+        self.fade_anim.stop()
         self.fade_anim.start()
 
         # Start shake after fade
-        QTimer.singleShot(100, self._do_shake)
-
-    def _do_shake(self) -> None:
-        """Perform the shake animation via stylesheet margin changes."""
-        self._shake_step = 0
-        self._shake_timer = QTimer(self)
-        self._shake_timer.timeout.connect(self._shake_tick)
-        self._shake_timer.start(50)
-
-    def _shake_tick(self) -> None:
-        """One frame of the shake animation."""
-        # Shake pattern: right, left, right, left, center
-        offsets = [8, -8, 6, -6, 4, -4, 2, -2, 0]
-
-        if self._shake_step < len(offsets):
-            offset = offsets[self._shake_step]
-            self.icon_label.setStyleSheet(
-                self._original_style +
-                f"\nQLabel {{ margin-left: {offset}px; }}"
-            )
-            self._shake_step += 1
+        QTimer.singleShot(100, self._start_shake)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Play the error animation the first time a new error is shown."""
+        super().showEvent(event)
+        if self._animation_pending:
+            self._animation_pending = False
+            self.play_error_animation()
+
+    def _start_shake(self) -> None:
+        """Shake the icon by animating its position."""
+        if self.shake_anim.state() == QPropertyAnimation.State.Running:
+            self.shake_anim.stop()
+            base = self.shake_anim.keyValueAt(0.0)
         else:
-            self._shake_timer.stop()
-            self.icon_label.setStyleSheet(self._original_style)
+            base = self.icon_label.pos()
+
+        self.shake_anim.setKeyValueAt(0.0, base)
+        for i, offset in enumerate(_SHAKE_OFFSETS, start=1):
+            self.shake_anim.setKeyValueAt(
+                i / len(_SHAKE_OFFSETS), QPoint(base.x() + offset, base.y())
+            )
+        self.shake_anim.start()
+
+    def _ensure_details_text(self) -> QPlainTextEdit:
+        """Build the details text box on first use.
+
+        Most errors are never expanded, so the QPlainTextEdit is not built
+        with the rest of the UI.
+
+        Returns:
+            The details text widget
+        """
+        if self.details_text is not None:
+            return self.details_text
+
+        self.details_text = QPlainTextEdit()
+        self.details_text.setReadOnly(True)
+        self.details_text.setObjectName("errorDetailsText")
+        self.details_text.setFixedHeight(100)
+        self.details_text.hide()
+        self.details_container.layout().addWidget(self.details_text)
+        return self.details_text
 
     def _toggle_details(self) -> None:
         """Toggle visibility of error details."""
-        self._details_visible = not self._details_visible
+        self._set_details_visible(not self._details_visible)
+
+    def _set_details_visible(self, visible: bool) -> None:
+        """Expand or collapse the error details.
 
-        if self._details_visible:
-            self.details_text.show()
+        Args:
+            visible: Whether the details text should be shown
+        """
+        if visible == self._details_visible:
+            return
+        self._details_visible = visible
+
+        if visible:
+            details_text = self._ensure_details_text()
+            details_text.setPlainText(self._error_details)
+            details_text.show()
             self.toggle_btn.setText("\u25BC  Hide Details")  # Down triangle
         else:
-            self.details_text.hide()
+            if self.details_text is not None:
+                self.details_text.hide()
             self.toggle_btn.setText("\u25B6  Show Details")  # Right triangle
 
     def set_error(self, message: str, details: str = "") -> None:
@@ -256,24 +297,26 @@ class ErrorScreen(QWidget):
         self._error_message = message
         self._error_details = details
 
-        # Parse error message for better display
-        display_message = message
-        if ":" in message:
-            # Extract the main error type
-            parts = message.split(":", 1)
-            display_message = parts[-1].strip()
+        # Parse error message for better display: drop the error type prefix
+        _, sep, rest = message.partition(":")
+        display_message = rest.strip() if sep else message
 
         self.message_label.setText(display_message[:100])  # Truncate if too long
-        self.details_text.setPlainText(details if details else message)
+
+        # Without a traceback there is nothing to expand
+        if details:
+            self.details_container.show()
+        else:
+            self.details_container.hide()
 
         # Set appropriate description based on error type
         description = self._get_error_description(message.lower())
         self.description_label.setText(description)
 
         # Reset details visibility
-        self._details_visible = False
-        self.details_text.hide()
-        self.toggle_btn.setText("\u25B6  Show Details")
+        self._set_details_visible(False)
+
+        self._animation_pending = True
 
     def _get_error_description(self, error: str) -> str:
         """Get a helpful description based on error type.
@@ -284,21 +327,13 @@ class ErrorScreen(QWidget):
         Returns:
             User-friendly description
         """
-        if "timeout" in error or "timed out" in error:
-            return "The connection took too long.\nCheck your internet and try again."
-        elif ("network" in error or "connection" in error) and "timed" not in error:
-            return "Network connection failed.\nPlease check your internet connection."
-        elif "invalid" in error and ("email" in error or "passcode" in error):
-            return "The credentials were rejected.\nPlease check and try again."
-        elif "permission" in error:
-            return "Cannot save to this location.\nTry a different folder in Settings."
-        elif "url" in error:
-            return "The URL format is invalid.\nMake sure it's a DocSend link."
-        elif "load" in error:
-            return "Could not load the document.\nIt may be unavailable or restricted."
-        elif "tesseract" in error:
-            return "OCR engine not found.\nInstall Tesseract for AI summaries."
-        elif "api" in error or "key" in error:
-            return "API key issue.\nCheck your Perplexity key in Settings."
-        else:
-            return "The conversion could not be completed.\nPlease check your internet and try again."
+        found = set(_ERROR_KEYWORD_RE.findall(error))
+        if found:
+            for any_of, also_any_of, none_of, description in _ERROR_DESCRIPTIONS:
+                if (
+                    found & any_of
+                    and (not also_any_of or found & also_any_of)
+                    and not found & none_of
+                ):
+                    return description
+        return _DEFAULT_ERROR_DESCRIPTION
@@ -0,0 +1,52 @@
+"""Shared screen header with a back arrow and title."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PySide6.QtWidgets import (
+    QWidget,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+)
+from PySide6.QtCore import Signal, Qt
+
+from topdf_app.ui import styles
+
+
+class BackHeader(QWidget):
+    """Header row with a back arrow button followed by a title.
+
+    Signals:
+        back_clicked: Emitted when the back arrow is clicked
+    """
+
+    back_clicked = Signal()
+
+    def __init__(self, title: str, parent: Optional[QWidget] = None):
+        """Initialize the header.
+
+        Args:
+            title: Title text shown next to the back arrow
+            parent: Optional parent widget
+        """
+        super().__init__(parent)
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(16)
+
+        self.back_btn = QPushButton("\u2190")  # Left arrow
+        self.back_btn.setFixedSize(32, 32)
+        self.back_btn.setStyleSheet(styles.BUTTON_BACK_STYLE)
+        self.back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.back_btn.clicked.connect(
+            self.back_clicked, Qt.ConnectionType.DirectConnection
+        )
+        layout.addWidget(self.back_btn)
+
+        self.title_label = QLabel(title)
+        self.title_label.setStyleSheet(styles.LABEL_TITLE_STYLE)
+        layout.addWidget(self.title_label)
+        layout.addStretch()
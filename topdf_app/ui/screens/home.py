@@ -18,28 +18,38 @@ from PySide6.QtWidgets import (
     QFrame,
     QApplication,
 )
-from PySide6.QtCore import Signal, Qt, QTimer
+from PySide6.QtCore import Signal, Qt, QSignalBlocker, QTimer
+from PySide6.QtGui import QIcon
 
 from topdf_app.ui import styles
+from topdf_app.ui.icons import glyph_pixmap
 
-
-# DocSend URL pattern
+# DocSend URL pattern (ASCII so IGNORECASE skips Unicode case folding)
 DOCSEND_URL_PATTERN = re.compile(
     r"https?://(?:www\.)?docsend\.com/view/[a-zA-Z0-9]+",
-    re.IGNORECASE,
+    re.IGNORECASE | re.ASCII,
 )
 
+# Shortest possible match: "http://docsend.com/view/" plus one id character
+_MIN_URL_LENGTH = len("http://docsend.com/view/") + 1
+
+# Pause after the last edit before the status message below the field updates
+STATUS_DELAY_MS = 120
+
 
 def is_valid_docsend_url(url: str) -> bool:
     """Check if a URL is a valid DocSend document URL.
 
     Args:
-        url: URL string to validate
+        url: URL string to validate, already stripped of whitespace
 
     Returns:
         True if valid DocSend URL
     """
-    return bool(DOCSEND_URL_PATTERN.match(url.strip()))
+    # Cheap rejects before running the regex (e.g. arbitrary clipboard text)
+    if len(url) < _MIN_URL_LENGTH or url[:4].lower() != "http":
+        return False
+    return DOCSEND_URL_PATTERN.match(url) is not None
 
 
 class HomeScreen(QWidget):
@@ -61,11 +71,31 @@ class HomeScreen(QWidget):
         """
         super().__init__(parent)
 
-        self._toast_timer: Optional[QTimer] = None
+        # Stripped URL text as of the last edit, and whether it is valid
+        self._url_text: str = ""
+        self._url_valid: bool = False
+        # Whether status_label is currently styled as valid (vs. error)
+        self._status_valid: bool = True
+
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(STATUS_DELAY_MS)
+        self._status_timer.timeout.connect(
+            self._update_status, Qt.ConnectionType.DirectConnection
+        )
+
+        self._toast_timer = QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.timeout.connect(
+            self._hide_toast, Qt.ConnectionType.DirectConnection
+        )
+
         self._setup_ui()
 
     def _setup_ui(self) -> None:
         """Setup the UI components."""
+        # All connections below stay on the GUI thread
+        direct = Qt.ConnectionType.DirectConnection
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(16)
@@ -80,15 +110,16 @@ class HomeScreen(QWidget):
 
         # Status label (for clipboard detection feedback)
         self.status_label = QLabel()
-        self.status_label.setStyleSheet(styles.LABEL_SUCCESS_STYLE)
+        self.status_label.setObjectName("homeStatus")
+        self.status_label.setProperty("valid", self._status_valid)
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.status_label)
 
         # Convert button
         self.convert_btn = QPushButton("Convert")
         self.convert_btn.setStyleSheet(styles.BUTTON_PRIMARY_STYLE)
-        self.convert_btn.setMinimumHeight(44)
-        self.convert_btn.clicked.connect(self._on_convert_clicked)
+        self.convert_btn.setFixedHeight(44)
+        self.convert_btn.clicked.connect(self._on_convert_clicked, direct)
         self.convert_btn.setEnabled(False)
         layout.addWidget(self.convert_btn)
 
@@ -97,15 +128,7 @@ class HomeScreen(QWidget):
 
         # Toast message (hidden by default, shows above Quit button)
         self.toast_label = QLabel()
-        self.toast_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {styles.COLORS['text_secondary']};
-                color: white;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-size: 13px;
-            }}
-        """)
+        self.toast_label.setObjectName("homeToast")
         self.toast_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.toast_label.hide()
         layout.addWidget(self.toast_label)
@@ -124,28 +147,18 @@ class HomeScreen(QWidget):
 
         header.addStretch()
 
+        # Gear emoji with variation selector
+        gear = glyph_pixmap("\u2699\uFE0F", 20, styles.COLORS['text_secondary'])
         settings_btn = QPushButton()
-        settings_btn.setText("\u2699\uFE0F")  # Gear emoji with variation selector
+        settings_btn.setIcon(QIcon(gear))
+        settings_btn.setIconSize(gear.deviceIndependentSize().toSize())
         settings_btn.setFixedSize(36, 36)
-        settings_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: 8px;
-                font-size: 20px;
-                color: {styles.COLORS['text_secondary']};
-            }}
-            QPushButton:hover {{
-                background-color: {styles.COLORS['surface']};
-                color: {styles.COLORS['text_primary']};
-            }}
-            QPushButton:pressed {{
-                background-color: {styles.COLORS['border']};
-            }}
-        """)
+        settings_btn.setObjectName("settingsButton")
         settings_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         settings_btn.setToolTip("Settings")
-        settings_btn.clicked.connect(self.settings_clicked.emit)
+        settings_btn.clicked.connect(
+            self.settings_clicked, Qt.ConnectionType.DirectConnection
+        )
         header.addWidget(settings_btn)
 
         return header
@@ -156,6 +169,7 @@ class HomeScreen(QWidget):
         Returns:
             Container widget with icon and input frame
         """
+        direct = Qt.ConnectionType.DirectConnection
         # Container for icon + frame
         container = QWidget()
         container_layout = QHBoxLayout(container)
@@ -163,24 +177,15 @@ class HomeScreen(QWidget):
         container_layout.setSpacing(8)
 
         # Link icon (OUTSIDE the frame)
-        icon_label = QLabel("\U0001F517")  # Link emoji
-        icon_label.setStyleSheet(f"""
-            QLabel {{
-                color: {styles.COLORS['text_muted']};
-                font-size: 18px;
-            }}
-        """)
+        icon_label = QLabel()
+        icon_label.setPixmap(
+            glyph_pixmap("\U0001F517", 18, styles.COLORS['text_muted'])  # Link emoji
+        )
         container_layout.addWidget(icon_label)
 
         # Input frame (contains text field and paste button)
         frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {styles.COLORS['surface']};
-                border: 1px solid {styles.COLORS['border']};
-                border-radius: 8px;
-            }}
-        """)
+        frame.setObjectName("urlFrame")
 
         layout = QHBoxLayout(frame)
         layout.setContentsMargins(12, 8, 8, 8)
@@ -189,37 +194,20 @@ class HomeScreen(QWidget):
         # URL input
         self.url_input = QLineEdit()
         self.url_input.setPlaceholderText("Paste DocSend URL")
-        self.url_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: transparent;
-                border: none;
-                color: {styles.COLORS['text_primary']};
-                font-size: {styles.FONTS['body_size']};
-            }}
-        """)
-        self.url_input.textChanged.connect(self._on_url_changed)
+        self.url_input.setObjectName("urlInput")
+        self.url_input.textChanged.connect(self._on_url_changed, direct)
         layout.addWidget(self.url_input, 1)
 
         # Paste button
-        self.paste_btn = QPushButton("\U0001F4CB")  # Clipboard emoji
+        clipboard_icon = glyph_pixmap("\U0001F4CB", 16)  # Clipboard emoji
+        self.paste_btn = QPushButton()
+        self.paste_btn.setIcon(QIcon(clipboard_icon))
+        self.paste_btn.setIconSize(clipboard_icon.deviceIndependentSize().toSize())
         self.paste_btn.setFixedSize(32, 32)
-        self.paste_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: 6px;
-                font-size: 16px;
-            }}
-            QPushButton:hover {{
-                background-color: {styles.COLORS['border']};
-            }}
-            QPushButton:pressed {{
-                background-color: {styles.COLORS['text_muted']};
-            }}
-        """)
+        self.paste_btn.setObjectName("pasteButton")
         self.paste_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.paste_btn.setToolTip("Paste from clipboard")
-        self.paste_btn.clicked.connect(self._on_paste_clicked)
+        self.paste_btn.clicked.connect(self._on_paste_clicked, direct)
         layout.addWidget(self.paste_btn)
 
         container_layout.addWidget(frame, 1)  # Frame stretches
@@ -234,9 +222,17 @@ class HomeScreen(QWidget):
             self.url_input.clear()
             return
 
-        text = clipboard.text()
-        if text and is_valid_docsend_url(text.strip()):
-            self.url_input.setText(text.strip())
+        text = clipboard.text().strip()
+        if is_valid_docsend_url(text):
+            # Already stripped and validated, so bypass _on_url_changed and
+            # show the status now rather than after the typing pause
+            with QSignalBlocker(self.url_input):
+                self.url_input.setText(text)
+            self._url_text = text
+            self._url_valid = True
+            self.convert_btn.setEnabled(True)
+            self._status_timer.stop()
+            self._update_status()
             self.url_input.setFocus()
         else:
             # Clear field and show toast for invalid/missing URL
@@ -250,17 +246,10 @@ class HomeScreen(QWidget):
             message: Message to display
             duration_ms: How long to show the toast (default 2.5 seconds)
         """
-        # Cancel any existing toast timer
-        if self._toast_timer is not None:
-            self._toast_timer.stop()
-
         self.toast_label.setText(message)
         self.toast_label.show()
 
-        # Setup timer to hide toast
-        self._toast_timer = QTimer(self)
-        self._toast_timer.setSingleShot(True)
-        self._toast_timer.timeout.connect(self._hide_toast)
+        # Restarting replaces any pending hide from an earlier toast
         self._toast_timer.start(duration_ms)
 
     def _hide_toast(self) -> None:
@@ -273,22 +262,43 @@ class HomeScreen(QWidget):
         Args:
             text: Current input text
         """
-        is_valid = is_valid_docsend_url(text)
-        self.convert_btn.setEnabled(is_valid)
+        self._url_text = text.strip()
+        self._url_valid = is_valid_docsend_url(self._url_text)
+        self.convert_btn.setEnabled(self._url_valid)
+
+        # Typing and paste bursts collapse into one status update
+        self._status_timer.start()
 
-        if text.strip() and not is_valid:
+    def _update_status(self) -> None:
+        """Show whether the entered URL is valid below the field."""
+        if self._url_valid:
+            self.status_label.setText("\u2713 Valid URL")
+            self._set_status_valid(True)
+        elif self._url_text:
             self.status_label.setText("Enter a valid DocSend URL")
-            self.status_label.setStyleSheet(styles.LABEL_ERROR_STYLE)
-        elif not text.strip():
-            self.status_label.setText("")
+            self._set_status_valid(False)
         else:
-            self.status_label.setText("\u2713 Valid URL")
-            self.status_label.setStyleSheet(styles.LABEL_SUCCESS_STYLE)
+            self.status_label.setText("")
+
+    def _set_status_valid(self, valid: bool) -> None:
+        """Switch the status label between its valid and error colors.
+
+        Args:
+            valid: Whether to use the valid (success) color
+        """
+        if valid == self._status_valid:
+            return
+        self._status_valid = valid
+        self.status_label.setProperty("valid", valid)
+        # Property selectors are only re-evaluated on polish
+        style = self.status_label.style()
+        style.unpolish(self.status_label)
+        style.polish(self.status_label)
 
     def _on_convert_clicked(self) -> None:
         """Handle convert button click."""
-        url = self.url_input.text().strip()
-        if is_valid_docsend_url(url):
+        url = self._url_text
+        if self._url_valid:
             # Emit signal FIRST - this synchronously sets block_focus_hide
             # flag in main_window before we disable the input
             self.convert_clicked.emit(url)
@@ -312,6 +322,7 @@ class HomeScreen(QWidget):
     def clear_input(self) -> None:
         """Clear the URL input field."""
         self.url_input.clear()
+        self._status_timer.stop()
         self.status_label.setText("")
         self.set_loading(False)
 
@@ -16,9 +16,25 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QGraphicsOpacityEffect,
 )
-from PySide6.QtCore import Signal, Qt, QTimer, QPropertyAnimation, QEasingCurve
+from PySide6.QtCore import (
+    Signal,
+    Qt,
+    QPropertyAnimation,
+    QSequentialAnimationGroup,
+    QEasingCurve,
+)
+from PySide6.QtGui import QHideEvent, QShowEvent
 
 from topdf_app.ui import styles
+from topdf_app.ui.icons import glyph_pixmap
+
+# Shared progress bar style with a slimmer bar and caption-size percentage
+_PROGRESS_BAR_STYLE = styles.PROGRESS_BAR_STYLE + f"""
+QProgressBar {{
+    height: 12px;
+    font-size: {styles.FONTS['caption_size']};
+}}
+"""
 
 
 class ProgressScreen(QWidget):
@@ -44,6 +60,8 @@ class ProgressScreen(QWidget):
 
     def _setup_ui(self) -> None:
         """Setup the UI components."""
+        # All connections below stay on the GUI thread
+        direct = Qt.ConnectionType.DirectConnection
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(16)
@@ -52,19 +70,9 @@ class ProgressScreen(QWidget):
         header = QHBoxLayout()
         self.back_btn = QPushButton("\u2190")  # Left arrow
         self.back_btn.setFixedSize(32, 32)
-        self.back_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                font-size: 18px;
-                color: {styles.COLORS['text_secondary']};
-            }}
-            QPushButton:hover {{
-                color: {styles.COLORS['text_primary']};
-            }}
-        """)
+        self.back_btn.setStyleSheet(styles.BUTTON_BACK_STYLE)
         self.back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.back_btn.clicked.connect(self.back_clicked.emit)
+        self.back_btn.clicked.connect(self.back_clicked, direct)
         header.addWidget(self.back_btn)
 
         self.title_label = QLabel("Converting...")
@@ -76,15 +84,11 @@ class ProgressScreen(QWidget):
         # Spacer
         layout.addStretch()
 
-        # Animated document icon (placeholder - using emoji for now)
-        icon_container = QHBoxLayout()
-        icon_container.addStretch()
-        self.icon_label = QLabel("\U0001F4C4")  # Document emoji
-        self.icon_label.setStyleSheet("font-size: 48px;")
+        # Animated document icon
+        self.icon_label = QLabel()
+        self.icon_label.setPixmap(glyph_pixmap("\U0001F4C4", 48))  # Document emoji
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_container.addWidget(self.icon_label)
-        icon_container.addStretch()
-        layout.addLayout(icon_container)
+        layout.addWidget(self.icon_label, 0, Qt.AlignmentFlag.AlignHCenter)
 
         layout.addSpacing(16)
 
@@ -94,12 +98,7 @@ class ProgressScreen(QWidget):
         self.progress_bar.setValue(0)
         self.progress_bar.setTextVisible(True)
         self.progress_bar.setFormat("%p%")
-        self.progress_bar.setStyleSheet(styles.PROGRESS_BAR_STYLE + f"""
-            QProgressBar {{
-                height: 12px;
-                font-size: {styles.FONTS['caption_size']};
-            }}
-        """)
+        self.progress_bar.setStyleSheet(_PROGRESS_BAR_STYLE)
         layout.addWidget(self.progress_bar)
 
         layout.addSpacing(8)
@@ -116,8 +115,8 @@ class ProgressScreen(QWidget):
         # Cancel button
         self.cancel_btn = QPushButton("Cancel")
         self.cancel_btn.setStyleSheet(styles.BUTTON_SECONDARY_STYLE)
-        self.cancel_btn.setMinimumHeight(44)
-        self.cancel_btn.clicked.connect(self._on_cancel)
+        self.cancel_btn.setFixedHeight(44)
+        self.cancel_btn.clicked.connect(self._on_cancel, direct)
         layout.addWidget(self.cancel_btn)
 
     def _setup_animations(self) -> None:
@@ -126,43 +125,36 @@ class ProgressScreen(QWidget):
         self.icon_opacity = QGraphicsOpacityEffect(self.icon_label)
         self.icon_label.setGraphicsEffect(self.icon_opacity)
 
-        # Create pulsing animation
-        self.pulse_animation = QPropertyAnimation(self.icon_opacity, b"opacity")
-        self.pulse_animation.setDuration(1000)
-        self.pulse_animation.setStartValue(1.0)
-        self.pulse_animation.setEndValue(0.5)
-        self.pulse_animation.setEasingCurve(QEasingCurve.Type.InOutSine)
+        # Fade out then back in, looped by Qt without a Python callback
+        self.pulse_animation = QSequentialAnimationGroup(self)
+        for start, end in ((1.0, 0.5), (0.5, 1.0)):
+            fade = QPropertyAnimation(self.icon_opacity, b"opacity")
+            fade.setDuration(1000)
+            fade.setStartValue(start)
+            fade.setEndValue(end)
+            fade.setEasingCurve(QEasingCurve.Type.InOutSine)
+            self.pulse_animation.addAnimation(fade)
         self.pulse_animation.setLoopCount(-1)  # Infinite loop
 
-        # Make it ping-pong (fade in and out)
-        self.pulse_timer = QTimer(self)
-        self.pulse_timer.timeout.connect(self._toggle_pulse_direction)
-        self.pulse_timer.setInterval(1000)
-
-        self._pulse_direction = 1
-
-    def _toggle_pulse_direction(self) -> None:
-        """Toggle the pulse animation direction."""
-        if self._pulse_direction == 1:
-            self.pulse_animation.setStartValue(0.5)
-            self.pulse_animation.setEndValue(1.0)
-        else:
-            self.pulse_animation.setStartValue(1.0)
-            self.pulse_animation.setEndValue(0.5)
-        self._pulse_direction *= -1
-        self.pulse_animation.start()
-
     def start_animation(self) -> None:
         """Start the pulsing animation."""
         self.pulse_animation.start()
-        self.pulse_timer.start()
 
     def stop_animation(self) -> None:
         """Stop the pulsing animation."""
         self.pulse_animation.stop()
-        self.pulse_timer.stop()
         self.icon_opacity.setOpacity(1.0)
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """Start pulsing whenever the screen becomes visible."""
+        super().showEvent(event)
+        self.start_animation()
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        """Stop pulsing whenever the screen is hidden."""
+        super().hideEvent(event)
+        self.stop_animation()
+
     def _on_cancel(self) -> None:
         """Handle cancel button click."""
         self.cancel_btn.setEnabled(False)
@@ -15,12 +15,114 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
     QFrame,
+    QGridLayout,
     QFileDialog,
 )
 from PySide6.QtCore import Signal, Qt
 
 from topdf_app.ui import styles
 
+# Toggle switch: knob on the left when off, on the right when on
+_TOGGLE_STYLE = f"""
+QPushButton:!checked {{
+    background-color: {styles.COLORS['border']};
+    border: none;
+    border-radius: 12px;
+    text-align: left;
+    padding-left: 4px;
+    color: white;
+    font-size: 14px;
+}}
+QPushButton:checked {{
+    background-color: {styles.COLORS['primary']};
+    border: none;
+    border-radius: 12px;
+    text-align: right;
+    padding-right: 4px;
+    color: white;
+    font-size: 14px;
+}}
+"""
+
+# Back arrow in the header
+_BACK_BTN_STYLE = f"""
+QPushButton {{
+    background-color: transparent;
+    border: none;
+    border-radius: 6px;
+    font-size: 18px;
+    color: {styles.COLORS['text_secondary']};
+}}
+QPushButton:hover {{
+    background-color: {styles.COLORS['surface']};
+    color: {styles.COLORS['text_primary']};
+}}
+"""
+
+# Setting row title
+_ROW_TITLE_STYLE = f"""
+QLabel {{
+    font-size: {styles.FONTS['body_size']};
+    font-weight: 500;
+    color: {styles.COLORS['text_primary']};
+}}
+"""
+
+# Setting row description or value
+_ROW_DESC_STYLE = f"""
+QLabel {{
+    font-size: {styles.FONTS['caption_size']};
+    color: {styles.COLORS['text_secondary']};
+}}
+"""
+
+# Change save location button
+_CHANGE_BTN_STYLE = f"""
+QPushButton {{
+    background-color: {styles.COLORS['surface']};
+    border: 1px solid {styles.COLORS['border']};
+    border-radius: 6px;
+    padding: 6px 12px;
+    font-size: {styles.FONTS['caption_size']};
+    color: {styles.COLORS['text_primary']};
+}}
+QPushButton:hover {{
+    background-color: {styles.COLORS['border']};
+}}
+"""
+
+# Keyboard shortcut badge
+_SHORTCUT_BADGE_STYLE = f"""
+QLabel {{
+    background-color: {styles.COLORS['surface']};
+    border: 1px solid {styles.COLORS['border']};
+    border-radius: 6px;
+    padding: 6px 10px;
+    font-size: {styles.FONTS['body_size']};
+    font-weight: 500;
+    color: {styles.COLORS['text_primary']};
+}}
+"""
+
+# Uppercase section header
+_SECTION_HEADER_STYLE = f"""
+QLabel {{
+    font-size: 11px;
+    font-weight: 600;
+    color: {styles.COLORS['text_muted']};
+    letter-spacing: 0.5px;
+}}
+"""
+
+# Rounded frame around a setting row
+_SETTING_ROW_STYLE = f"""
+QFrame {{
+    background-color: {styles.COLORS['surface']};
+    border: 1px solid {styles.COLORS['border']};
+    border-radius: 8px;
+}}
+"""
+
 
 class ToggleSwitch(QPushButton):
     """Custom toggle switch widget."""
@@ -32,49 +134,18 @@ class ToggleSwitch(QPushButton):
         self.setCheckable(True)
         self.setFixedSize(44, 24)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.clicked.connect(self._on_clicked)
-        self._update_style()
-
-    def _on_clicked(self) -> None:
-        self._update_style()
-        self.toggled_signal.emit(self.isChecked())
-
-    def _update_style(self) -> None:
-        if self.isChecked():
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {styles.COLORS['primary']};
-                    border: none;
-                    border-radius: 12px;
-                    text-align: right;
-                    padding-right: 4px;
-                    color: white;
-                    font-size: 14px;
-                }}
-            """)
-            self.setText("\u25CF")
-        else:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {styles.COLORS['border']};
-                    border: none;
-                    border-radius: 12px;
-                    text-align: left;
-                    padding-left: 4px;
-                    color: white;
-                    font-size: 14px;
-                }}
-            """)
-            self.setText("\u25CF")
-
-    def setChecked(self, checked: bool) -> None:
-        super().setChecked(checked)
-        self._update_style()
+        self.setText("\u25CF")  # Knob
+        # The :checked pseudo-state restyles the switch when it toggles
+        self.setStyleSheet(_TOGGLE_STYLE)
+        self.clicked.connect(self.toggled_signal, Qt.ConnectionType.DirectConnection)
 
 
 class SettingsPanel(QWidget):
     """Settings panel with configuration options.
 
+    Built on first open by MainWindow, which then applies the current
+    values via set_save_folder() and set_start_at_login().
+
     Signals:
         closed: Emitted when settings panel is closed
         save_folder_changed: Emitted with new save folder path
@@ -87,10 +158,16 @@ class SettingsPanel(QWidget):
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
+        # Home directory, resolved once for shortening displayed paths
+        self._home = str(Path.home())
+        # Full path of the folder shown in save_path_label
+        self._save_folder = str(Path(self._home) / "Downloads")
         self._setup_ui()
 
     def _setup_ui(self) -> None:
         """Setup the UI components."""
+        # All connections below stay on the GUI thread
+        direct = Qt.ConnectionType.DirectConnection
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 20, 24, 24)
         layout.setSpacing(0)
@@ -101,21 +178,9 @@ class SettingsPanel(QWidget):
 
         self.back_btn = QPushButton("\u2190")
         self.back_btn.setFixedSize(32, 32)
-        self.back_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: 6px;
-                font-size: 18px;
-                color: {styles.COLORS['text_secondary']};
-            }}
-            QPushButton:hover {{
-                background-color: {styles.COLORS['surface']};
-                color: {styles.COLORS['text_primary']};
-            }}
-        """)
+        self.back_btn.setStyleSheet(_BACK_BTN_STYLE)
         self.back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.back_btn.clicked.connect(self.closed.emit)
+        self.back_btn.clicked.connect(self.closed, direct)
         header.addWidget(self.back_btn)
 
         title = QLabel("Settings")
@@ -131,89 +196,21 @@ class SettingsPanel(QWidget):
         layout.addSpacing(8)
 
         # Save Location row
-        save_row = self._create_setting_row()
-        save_row_layout = QHBoxLayout(save_row)
-        save_row_layout.setContentsMargins(16, 12, 16, 12)
-
-        save_left = QVBoxLayout()
-        save_left.setSpacing(2)
-        save_title = QLabel("Save location")
-        save_title.setStyleSheet(f"""
-            QLabel {{
-                font-size: {styles.FONTS['body_size']};
-                font-weight: 500;
-                color: {styles.COLORS['text_primary']};
-            }}
-        """)
-        save_left.addWidget(save_title)
-
-        self.save_path_label = QLabel("~/Downloads")
-        self.save_path_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: {styles.FONTS['caption_size']};
-                color: {styles.COLORS['text_secondary']};
-            }}
-        """)
-        save_left.addWidget(self.save_path_label)
-        save_row_layout.addLayout(save_left)
-
-        save_row_layout.addStretch()
-
         change_btn = QPushButton("Change")
-        change_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {styles.COLORS['surface']};
-                border: 1px solid {styles.COLORS['border']};
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-size: {styles.FONTS['caption_size']};
-                color: {styles.COLORS['text_primary']};
-            }}
-            QPushButton:hover {{
-                background-color: {styles.COLORS['border']};
-            }}
-        """)
+        change_btn.setStyleSheet(_CHANGE_BTN_STYLE)
         change_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        change_btn.clicked.connect(self._on_change_save_location)
-        save_row_layout.addWidget(change_btn)
-
-        layout.addWidget(save_row)
+        change_btn.clicked.connect(self._on_change_save_location, direct)
+        self.save_path_label = self._add_setting_row(
+            layout, "Save location", "~/Downloads", change_btn
+        )
         layout.addSpacing(1)
 
         # Start at Login row
-        login_row = self._create_setting_row()
-        login_row_layout = QHBoxLayout(login_row)
-        login_row_layout.setContentsMargins(16, 12, 16, 12)
-
-        login_left = QVBoxLayout()
-        login_left.setSpacing(2)
-        login_title = QLabel("Start at login")
-        login_title.setStyleSheet(f"""
-            QLabel {{
-                font-size: {styles.FONTS['body_size']};
-                font-weight: 500;
-                color: {styles.COLORS['text_primary']};
-            }}
-        """)
-        login_left.addWidget(login_title)
-
-        login_desc = QLabel("Launch app when you log in")
-        login_desc.setStyleSheet(f"""
-            QLabel {{
-                font-size: {styles.FONTS['caption_size']};
-                color: {styles.COLORS['text_secondary']};
-            }}
-        """)
-        login_left.addWidget(login_desc)
-        login_row_layout.addLayout(login_left)
-
-        login_row_layout.addStretch()
-
         self.login_toggle = ToggleSwitch()
-        self.login_toggle.toggled_signal.connect(self._on_login_toggle)
-        login_row_layout.addWidget(self.login_toggle)
-
-        layout.addWidget(login_row)
+        self.login_toggle.toggled_signal.connect(self._on_login_toggle, direct)
+        self._add_setting_row(
+            layout, "Start at login", "Launch app when you log in", self.login_toggle
+        )
 
         layout.addSpacing(24)
 
@@ -221,97 +218,83 @@ class SettingsPanel(QWidget):
         layout.addWidget(self._create_section_header("Keyboard Shortcut"))
         layout.addSpacing(8)
 
-        shortcut_row = self._create_setting_row()
-        shortcut_row_layout = QHBoxLayout(shortcut_row)
-        shortcut_row_layout.setContentsMargins(16, 12, 16, 12)
-
-        shortcut_left = QVBoxLayout()
-        shortcut_left.setSpacing(2)
-        shortcut_title = QLabel("Quick open")
-        shortcut_title.setStyleSheet(f"""
-            QLabel {{
-                font-size: {styles.FONTS['body_size']};
-                font-weight: 500;
-                color: {styles.COLORS['text_primary']};
-            }}
-        """)
-        shortcut_left.addWidget(shortcut_title)
-
-        shortcut_desc = QLabel("Open app from anywhere")
-        shortcut_desc.setStyleSheet(f"""
-            QLabel {{
-                font-size: {styles.FONTS['caption_size']};
-                color: {styles.COLORS['text_secondary']};
-            }}
-        """)
-        shortcut_left.addWidget(shortcut_desc)
-        shortcut_row_layout.addLayout(shortcut_left)
-
-        shortcut_row_layout.addStretch()
-
         shortcut_badge = QLabel("\u2318\u21E7D")
-        shortcut_badge.setStyleSheet(f"""
-            QLabel {{
-                background-color: {styles.COLORS['surface']};
-                border: 1px solid {styles.COLORS['border']};
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-size: {styles.FONTS['body_size']};
-                font-weight: 500;
-                color: {styles.COLORS['text_primary']};
-            }}
-        """)
-        shortcut_row_layout.addWidget(shortcut_badge)
-
-        layout.addWidget(shortcut_row)
+        shortcut_badge.setStyleSheet(_SHORTCUT_BADGE_STYLE)
+        self._add_setting_row(
+            layout, "Quick open", "Open app from anywhere", shortcut_badge
+        )
 
         layout.addStretch()
 
     def _create_section_header(self, title: str) -> QLabel:
         """Create a section header label."""
         label = QLabel(title.upper())
-        label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 11px;
-                font-weight: 600;
-                color: {styles.COLORS['text_muted']};
-                letter-spacing: 0.5px;
-            }}
-        """)
+        label.setStyleSheet(_SECTION_HEADER_STYLE)
         return label
 
-    def _create_setting_row(self) -> QFrame:
-        """Create a setting row frame."""
+    def _add_setting_row(
+        self,
+        layout: QVBoxLayout,
+        title: str,
+        description: str,
+        control: QWidget,
+    ) -> QLabel:
+        """Add a setting row with a title, a description and a control.
+
+        Args:
+            layout: Layout to add the row to
+            title: Row title
+            description: Text shown under the title
+            control: Widget shown at the right of the row
+
+        Returns:
+            The description label
+        """
         frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {styles.COLORS['surface']};
-                border: 1px solid {styles.COLORS['border']};
-                border-radius: 8px;
-            }}
-        """)
-        return frame
+        frame.setStyleSheet(_SETTING_ROW_STYLE)
+        grid = QGridLayout(frame)
+        grid.setContentsMargins(16, 12, 16, 12)
+        grid.setVerticalSpacing(2)
+        # Text keeps its natural width; the empty middle column takes the slack
+        grid.setColumnStretch(1, 1)
+
+        title_label = QLabel(title)
+        title_label.setStyleSheet(_ROW_TITLE_STYLE)
+        grid.addWidget(title_label, 0, 0)
+
+        desc_label = QLabel(description)
+        desc_label.setStyleSheet(_ROW_DESC_STYLE)
+        grid.addWidget(desc_label, 1, 0)
+
+        grid.addWidget(control, 0, 2, 2, 1)
+
+        layout.addWidget(frame)
+        return desc_label
+
+    def _compact_home(self, path: str) -> str:
+        """Shorten a path under the home directory to start with "~".
+
+        Args:
+            path: Absolute folder path
+
+        Returns:
+            Path for display
+        """
+        if path.startswith(self._home):
+            return "~" + path[len(self._home):]
+        return path
 
     def _on_change_save_location(self) -> None:
         """Handle save location change."""
-        current = self.save_path_label.text()
-        if current.startswith("~"):
-            current = str(Path.home() / current[2:])
-
         folder = QFileDialog.getExistingDirectory(
             self,
             "Select Save Location",
-            current,
+            self._save_folder,
             QFileDialog.Option.ShowDirsOnly,
         )
 
         if folder:
-            display = folder
-            home = str(Path.home())
-            if folder.startswith(home):
-                display = "~" + folder[len(home):]
-
-            self.save_path_label.setText(display)
+            self.set_save_folder(folder)
             self.save_folder_changed.emit(folder)
 
     def _on_login_toggle(self, checked: bool) -> None:
@@ -320,11 +303,8 @@ class SettingsPanel(QWidget):
 
     def set_save_folder(self, path: str) -> None:
         """Set the save folder display."""
-        display = path
-        home = str(Path.home())
-        if path.startswith(home):
-            display = "~" + path[len(home):]
-        self.save_path_label.setText(display)
+        self._save_folder = path
+        self.save_path_label.setText(self._compact_home(path))
 
     def set_start_at_login(self, enabled: bool) -> None:
         """Set the start at login toggle."""
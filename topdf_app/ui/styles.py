@@ -99,6 +99,19 @@ QPushButton:hover {{
 }}
 """
 
+# Header back-arrow button style
+BUTTON_BACK_STYLE = f"""
+QPushButton {{
+    background-color: transparent;
+    border: none;
+    font-size: 18px;
+    color: {COLORS['text_secondary']};
+}}
+QPushButton:hover {{
+    color: {COLORS['text_primary']};
+}}
+"""
+
 # Input styles
 INPUT_STYLE = f"""
 QLineEdit {{
@@ -207,6 +220,139 @@ QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
 }}
 """
 
+# Dropdown footer styles (applied by object name)
+FOOTER_STYLE = f"""
+#dropdownFooter {{
+    background-color: {COLORS['surface']};
+    border-top: 1px solid {COLORS['border']};
+}}
+"""
+
+BRANDING_STYLE = f"""
+#brandingContainer {{
+    background-color: #1F2937;
+    border-radius: 10px;
+    border: none;
+}}
+#brandingContainer:hover {{
+    background-color: #374151;
+}}
+#brandingContainer:pressed {{
+    background-color: #1F2937;
+}}
+#brandingLogo {{
+    background: transparent;
+}}
+#footerLine1 {{
+    color: #E5E7EB;
+    font-size: 17px;
+    background: transparent;
+}}
+#footerLine2 {{
+    color: #9CA3AF;
+    font-size: 16px;
+    background: transparent;
+}}
+"""
+
+QUIT_BUTTON_STYLE = f"""
+#quitButton {{
+    background-color: #F3F4F6;
+    border: 1px solid {COLORS['border']};
+    border-radius: 8px;
+    color: #374151;
+    font-size: 14px;
+    font-weight: 500;
+    padding: 8px 16px;
+}}
+#quitButton:hover {{
+    background-color: {COLORS['border']};
+    border-color: #D1D5DB;
+}}
+#quitButton:pressed {{
+    background-color: #D1D5DB;
+}}
+"""
+
+# Home screen styles (applied by object name)
+HOME_STYLE = f"""
+#homeStatus {{
+    color: {COLORS['success']};
+    font-size: {FONTS['caption_size']};
+}}
+#homeStatus[valid="false"] {{
+    color: {COLORS['error']};
+}}
+#homeToast {{
+    background-color: {COLORS['text_secondary']};
+    color: white;
+    padding: 8px 16px;
+    border-radius: 6px;
+    font-size: 13px;
+}}
+#settingsButton {{
+    background-color: transparent;
+    border: none;
+    border-radius: 8px;
+}}
+#settingsButton:hover {{
+    background-color: {COLORS['surface']};
+}}
+#settingsButton:pressed {{
+    background-color: {COLORS['border']};
+}}
+#urlFrame {{
+    background-color: {COLORS['surface']};
+    border: 1px solid {COLORS['border']};
+    border-radius: 8px;
+}}
+#urlInput {{
+    background-color: transparent;
+    border: none;
+    color: {COLORS['text_primary']};
+    font-size: {FONTS['body_size']};
+}}
+#pasteButton {{
+    background-color: transparent;
+    border: none;
+    border-radius: 6px;
+}}
+#pasteButton:hover {{
+    background-color: {COLORS['border']};
+}}
+#pasteButton:pressed {{
+    background-color: {COLORS['text_muted']};
+}}
+"""
+
+# Error screen details box styles (applied by object name)
+ERROR_DETAILS_STYLE = f"""
+#errorDetails {{
+    background-color: {COLORS['surface']};
+    border: 1px solid {COLORS['border']};
+    border-radius: 8px;
+}}
+#errorDetailsToggle {{
+    background-color: transparent;
+    border: none;
+    color: {COLORS['text_secondary']};
+    font-size: {FONTS['caption_size']};
+    text-align: left;
+    padding: 4px;
+}}
+#errorDetailsToggle:hover {{
+    color: {COLORS['text_primary']};
+}}
+#errorDetailsText {{
+    background-color: {COLORS['surface']};
+    border: none;
+    border-radius: 8px;
+    color: {COLORS['text_secondary']};
+    font-family: 'SF Mono', 'Monaco', 'Menlo', monospace;
+    font-size: 11px;
+}}
+"""
+
 # Combined application stylesheet
 APP_STYLESHEET = f"""
 * {{
@@ -215,6 +361,13 @@ APP_STYLESHEET = f"""
 
 {MAIN_WINDOW_STYLE}
 {SCROLLBAR_STYLE}
+
+{FOOTER_STYLE}
+{BRANDING_STYLE}
+{QUIT_BUTTON_STYLE}
+
+{HOME_STYLE}
+{ERROR_DETAILS_STYLE}
 """
 
 
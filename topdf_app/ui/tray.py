@@ -5,12 +5,16 @@ Provides the system tray icon and context menu for the application.
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Tuple, TYPE_CHECKING
 
-from PySide6.QtWidgets import QSystemTrayIcon
-from PySide6.QtGui import QIcon
-from PySide6.QtCore import Signal, QObject
+from PySide6.QtWidgets import QMenu, QSystemTrayIcon
+from PySide6.QtGui import QAction, QIcon
+from PySide6.QtCore import Signal, Slot, QObject
+
+if TYPE_CHECKING:
+    from topdf_app.core.history import HistoryEntry
 
 
 def get_icon_path(name: str) -> Path:
@@ -22,8 +26,6 @@ def get_icon_path(name: str) -> Path:
     Returns:
         Path to the icon file
     """
-    import sys
-
     # When running as a bundled app (PyInstaller)
     if getattr(sys, 'frozen', False):
         # PyInstaller puts data files in the app's Resources directory
@@ -48,12 +50,12 @@ def load_tray_icon() -> QIcon:
         QIcon loaded from tray_icon.png (and tray_icon@2x.png for Retina)
     """
     icon_path = get_icon_path("tray_icon.png")
-    if icon_path.exists():
-        return QIcon(str(icon_path))
-    else:
-        # Fallback: return empty icon (shouldn't happen in normal operation)
+    # QIcon is null when the file is missing, so no separate exists() check
+    icon = QIcon(str(icon_path))
+    if icon.isNull():
+        # Fallback: empty icon (shouldn't happen in normal operation)
         print(f"Warning: Tray icon not found at {icon_path}")
-        return QIcon()
+    return icon
 
 
 class TrayIcon(QSystemTrayIcon):
@@ -79,6 +81,9 @@ class TrayIcon(QSystemTrayIcon):
 
         self._is_converting = False
         self._history_actions: List = []
+        # Menu and (name, pdf_path) pairs the history actions were built for
+        self._history_menu: Optional[QMenu] = None
+        self._history_shown: Tuple[Tuple[str, str], ...] = ()
 
         # Load icon from PNG file (Qt handles @2x automatically)
         self._icon = load_tray_icon()
@@ -120,22 +125,30 @@ class TrayIcon(QSystemTrayIcon):
         # TODO: Add separate active icon if visual feedback during conversion is needed
         # For now, icon stays the same
 
-    def update_history(self, history_items: List[Dict]) -> None:
+    def update_history(self, history_items: List[HistoryEntry]) -> None:
         """Update the history section of the context menu.
 
         Args:
-            history_items: List of history item dicts with 'name' and 'pdf_path'
+            history_items: History entries, newest first
         """
         menu = self.contextMenu()
         if not menu:
             return
 
+        # Max 5 in tray menu; nothing to do if those are already shown
+        shown = tuple((entry.name, entry.pdf_path) for entry in history_items[:5])
+        if menu is self._history_menu and shown == self._history_shown:
+            return
+        self._history_menu = menu
+        self._history_shown = shown
+
         # Remove old history actions
         for action in self._history_actions:
             menu.removeAction(action)
+            action.deleteLater()
         self._history_actions.clear()
 
-        if not history_items:
+        if not shown:
             return
 
         # Find the separator after "Open" to insert history items
@@ -146,38 +159,35 @@ class TrayIcon(QSystemTrayIcon):
                 insert_before = action
                 break
 
+        def place(action: QAction) -> None:
+            # insertAction() appends when insert_before is None
+            menu.insertAction(insert_before, action)
+            self._history_actions.append(action)
+
         # Add "Recent" label
-        recent_label = menu.addAction("Recent Conversions")
+        recent_label = QAction("Recent Conversions", menu)
         recent_label.setEnabled(False)
-        if insert_before:
-            menu.removeAction(recent_label)
-            menu.insertAction(insert_before, recent_label)
-        self._history_actions.append(recent_label)
-
-        # Add history items (max 5 in tray menu)
-        for item in history_items[:5]:
-            name = item.get("name", "Unknown")
-            pdf_path = item.get("pdf_path", "")
-
-            action = menu.addAction(f"  {name}")
-            # Store path in action data
-            action.setData(pdf_path)
-            action.triggered.connect(
-                lambda checked, path=pdf_path: self._on_history_item_clicked(path)
-            )
-
-            if insert_before:
-                menu.removeAction(action)
-                menu.insertAction(insert_before, action)
+        place(recent_label)
 
-            self._history_actions.append(action)
+        # Add history items
+        for name, pdf_path in shown:
+            action = QAction(f"  {name}", menu)
+            # Store path in action data for the shared click handler
+            action.setData(pdf_path)
+            action.triggered.connect(self._on_history_action_triggered)
+            place(action)
 
         # Add separator after history
-        sep = menu.addSeparator()
-        if insert_before:
-            menu.removeAction(sep)
-            menu.insertAction(insert_before, sep)
-        self._history_actions.append(sep)
+        sep = QAction(menu)
+        sep.setSeparator(True)
+        place(sep)
+
+    @Slot()
+    def _on_history_action_triggered(self) -> None:
+        """Handle a click on any history action."""
+        action = self.sender()
+        if isinstance(action, QAction):
+            self._on_history_item_clicked(action.data())
 
     def _on_history_item_clicked(self, pdf_path: str) -> None:
         """Handle history item click.